@@ -1,10 +1,18 @@
 """ASCII art and visual elements for WonderDash."""
 
-from rich.text import Text
-from rich.console import Console
+from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    from rich.text import Text
+
+@lru_cache(maxsize=1)
 def get_wonder_dash_logo() -> Text:
     """Return the main WonderDash ASCII art logo."""
+    from rich.text import Text
+
     logo = Text()
     
     # Main ASCII art
@@ -33,8 +41,11 @@ def get_wonder_dash_logo() -> Text:
     
     return logo
 
+@lru_cache(maxsize=1)
 def get_compact_logo() -> Text:
     """Return a compact version of the logo for smaller displays."""
+    from rich.text import Text
+
     logo = Text()
     
     compact_art = """
@@ -63,8 +74,11 @@ def get_neon_border(width: int = 60) -> str:
     """Return a neon-style border."""
     return "═" * width
 
+@lru_cache(maxsize=1)
 def get_welcome_message() -> Text:
     """Return a styled welcome message."""
+    from rich.text import Text
+
     message = Text()
     message.append("🌟 Welcome to ", style="white")
     message.append("WonderDash", style="bold bright_cyan")
@@ -3,129 +3,93 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable, Sequence
 
-from .config import WonderConfig, config_path, load_config, save_config
 
+# Handlers are named rather than referenced so `commands` is only imported on dispatch.
+COMMANDS = (
+    ("setup", "Run the interactive setup wizard.", "cmd_setup"),
+    ("dashboard", "Launch the terminal dashboard.", "cmd_dashboard"),
+    ("hub", "Launch the WonderDash hub menu.", "cmd_hub"),
+    ("show-config", "Display current configuration.", "cmd_show_config"),
+    ("list-distributions", "List CloudFront distributions for the configured profile.", "cmd_list_distributions"),
+)
+COMMAND_NAMES = frozenset(name for name, _, _ in COMMANDS)
+# Bare `wonder-dash <command>` invocations skip argparse entirely.
+FAST_DISPATCH = {name: handler_name for name, _, handler_name in COMMANDS}
 
-def _require_boto3():
-    try:
-        import boto3  # noqa: F401
-    except ModuleNotFoundError as exc:  # pragma: no cover
-        print("This command requires boto3. Install it with `pip install boto3`.", file=sys.stderr)
-        raise SystemExit(1) from exc
 
+def __getattr__(name: str) -> Any:
+    """Resolve ``cmd_*`` handlers from :mod:`wonder_dash.commands` on first access."""
+    if name.startswith("cmd_"):
+        from . import commands
 
-def cmd_setup(args: argparse.Namespace) -> None:
-    from .wizard import run_setup
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    existing = None
-    try:
-        existing = load_config()
-    except RuntimeError:
-        existing = None
-    run_setup(existing)
 
+def _handler(name: str) -> Callable[[argparse.Namespace], None]:
+    return getattr(sys.modules[__name__], name)
 
-def cmd_dashboard(args: argparse.Namespace) -> None:
-    from .dashboard import run_dashboard
 
-    config = load_config()
-    run_dashboard(config)
+def _sniff_subcommand(argv: Iterable[str]) -> str | None:
+    """Return the first token naming a known subcommand, if any."""
+    for token in argv:
+        if token in COMMAND_NAMES:
+            return token
+    return None
 
 
-def cmd_hub(args: argparse.Namespace) -> None:
-    from .hub import launch_hub
-
-    launch_hub()
-
-
-def cmd_show_config(args: argparse.Namespace) -> None:
-    try:
-        config = load_config()
-    except RuntimeError as exc:
-        print(f"Failed to read config: {exc}", file=sys.stderr)
-        raise SystemExit(1) from exc
-
-    path = config_path()
-    data = config.to_dict()
-    print(f"Config path: {path}")
-    print(json.dumps(data, indent=2, sort_keys=True))
-
-
-def cmd_list_distributions(args: argparse.Namespace) -> None:
-    _require_boto3()
-    import boto3
-    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, ProfileNotFound
-
-    config = load_config()
-    session_kwargs = {}
-    if config.aws_profile:
-        session_kwargs["profile_name"] = config.aws_profile
-
-    try:
-        session = boto3.Session(**session_kwargs)
-        cf = session.client("cloudfront")
-        paginator = cf.get_paginator("list_distributions")
-        found = False
-        for page in paginator.paginate():
-            for dist in page.get("DistributionList", {}).get("Items", []) or []:
-                found = True
-                marker = "*" if dist["Id"] == config.distribution_id else " "
-                aliases = dist.get("Aliases", {}).get("Items", [])
-                alias_str = ", ".join(aliases) if aliases else "-"
-                print(f"{dist['Id']} {marker}  Origins: {dist['Origins']['Quantity']}  Aliases: {alias_str}")
-        if not found:
-            print("No distributions returned for this account.")
-    except (ProfileNotFound, NoCredentialsError):
-        print("Unable to locate AWS credentials/profile. Run `aws configure`.", file=sys.stderr)
-        raise SystemExit(1)
-    except (BotoCoreError, ClientError) as exc:
-        print(f"Error listing distributions: {exc}", file=sys.stderr)
-        raise SystemExit(1)
-
-
-def build_parser() -> argparse.ArgumentParser:
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, registering just ``only`` when a subcommand is known."""
     parser = argparse.ArgumentParser(
         prog="wonder-dash",
         description="WonderDash – CloudFront request dashboard and setup assistant.",
     )
-    parser.set_defaults(func=None)
+    parser.set_defaults(func_name=None)
 
     subparsers = parser.add_subparsers(dest="command")
 
-    setup_parser = subparsers.add_parser("setup", help="Run the interactive setup wizard.")
-    setup_parser.set_defaults(func=cmd_setup)
+    for name, help_text, handler_name in COMMANDS:
+        if only is not None and name != only:
+            continue
+        command_parser = subparsers.add_parser(name, help=help_text)
+        command_parser.set_defaults(func_name=handler_name)
 
-    dash_parser = subparsers.add_parser("dashboard", help="Launch the terminal dashboard.")
-    dash_parser.set_defaults(func=cmd_dashboard)
-
-    hub_parser = subparsers.add_parser("hub", help="Launch the WonderDash hub menu.")
-    hub_parser.set_defaults(func=cmd_hub)
+    return parser
 
-    show_parser = subparsers.add_parser("show-config", help="Display current configuration.")
-    show_parser.set_defaults(func=cmd_show_config)
 
-    list_parser = subparsers.add_parser("list-distributions", help="List CloudFront distributions for the configured profile.")
-    list_parser.set_defaults(func=cmd_list_distributions)
+def main(argv: Iterable[str] | None = None) -> int:
+    args_list: Sequence[str]
+    if argv is None:
+        args_list = sys.argv[1:]
+    elif isinstance(argv, (list, tuple)):
+        args_list = argv
+    else:
+        args_list = list(argv)
+
+    if not args_list:
+        from .hub import launch_hub
 
-    return parser
+        launch_hub()
+        return 0
 
+    if len(args_list) == 1 and args_list[0] in FAST_DISPATCH:
+        handler_name = FAST_DISPATCH[args_list[0]]
+        _handler(handler_name)(argparse.Namespace(command=args_list[0], func_name=handler_name))
+        return 0
 
-def main(argv: Iterable[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+    parser = build_parser(only=_sniff_subcommand(args_list))
+    args = parser.parse_args(args_list)
 
-    if not hasattr(args, "func") or args.func is None:
+    if getattr(args, "func_name", None) is None:
         from .hub import launch_hub
 
         launch_hub()
         return 0
 
-    args.func(args)
+    _handler(args.func_name)(args)
     return 0
 
 
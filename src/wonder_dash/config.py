@@ -4,12 +4,34 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass, asdict
+import re
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any, Dict, Optional
 
+try:  # optional faster JSON codec
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
 CONFIG_FILENAME = "config.json"
 ENV_CONFIG_PATH = "WONDER_DASH_CONFIG"
+ENV_FSYNC = "WONDER_DASH_FSYNC"
+_NON_PRINTABLE_ASCII = re.compile(r"[^\x20-\x7e]")
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8") + b"\n"
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _default_config_dir() -> Path:
@@ -27,8 +49,13 @@ def _default_config_dir() -> Path:
     return base / "wonder_dash"
 
 
+@lru_cache(maxsize=1)
 def config_path() -> Path:
-    """Full path to the config file."""
+    """Full path to the config file.
+
+    Resolved once per process; call ``config_path.cache_clear()`` after changing
+    ``WONDER_DASH_CONFIG`` or the platform config variables at runtime.
+    """
     return _default_config_dir() / CONFIG_FILENAME
 
 
@@ -58,7 +85,8 @@ class WonderConfig:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
-    def ensure_valid(self) -> None:
+    def ensure_valid(self) -> bool:
+        """Validate and normalize fields in place; return True if anything changed."""
         if self.period_seconds <= 0:
             raise ValueError("period_seconds must be positive")
         if self.window_minutes <= 0:
@@ -66,40 +94,56 @@ class WonderConfig:
         if self.poll_seconds <= 0:
             raise ValueError("poll_seconds must be positive")
 
+        changed = False
+
         # CloudFront metrics require 60-second multiples for period.
         if self.period_seconds < 60:
             self.period_seconds = 60
+            changed = True
         if self.period_seconds % 60 != 0:
             remainder = self.period_seconds % 60
             self.period_seconds += 60 - remainder
+            changed = True
 
         if self.distribution_id is not None:
-            cleaned = "".join(ch for ch in self.distribution_id.strip() if 32 <= ord(ch) <= 126)
+            # Keep printable ASCII only; the pattern also rejects any non-ASCII input.
+            cleaned = _NON_PRINTABLE_ASCII.sub("", self.distribution_id.strip())
             if cleaned != self.distribution_id:
                 self.distribution_id = cleaned
-            if self.distribution_id and not self.distribution_id.isascii():
-                # Ascii guard (strip already handled non-printable)
-                self.distribution_id = self.distribution_id.encode("ascii", "ignore").decode()
+                changed = True
             if self.distribution_id == "":
                 self.distribution_id = None
 
+        return changed
+
 
 def load_config() -> WonderConfig:
-    """Load config from disk or return defaults."""
+    """Load config from disk or return defaults.
+
+    The parsed file is cached against its modification time and size, so repeated
+    calls cost one ``stat``; each caller gets its own copy to modify.
+    """
     path = config_path()
-    if path.is_file():
-        try:
-            with path.open("r", encoding="utf-8") as fp:
-                data = json.load(fp)
-            config = WonderConfig.from_dict(data)
-            config.ensure_valid()
-            if config.to_dict() != data:
-                # Persist normalization (period rounding, etc.) back to disk.
-                save_config(config)
-            return config
-        except (json.JSONDecodeError, OSError, ValueError) as exc:
-            raise RuntimeError(f"Failed to load WonderDash config: {exc}") from exc
-    return WonderConfig()
+    try:
+        stat = path.stat()
+    except OSError:
+        return WonderConfig()
+    if not S_ISREG(stat.st_mode):
+        return WonderConfig()
+    return replace(_read_config(path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=1)
+def _read_config(path: Path, mtime_ns: int, size: int) -> WonderConfig:
+    try:
+        data = _loads(path.read_bytes())
+        config = WonderConfig.from_dict(data)
+        if config.ensure_valid():
+            # Persist normalization (period rounding, etc.) back to disk.
+            save_config(config)
+        return config
+    except (json.JSONDecodeError, OSError, ValueError) as exc:
+        raise RuntimeError(f"Failed to load WonderDash config: {exc}") from exc
 
 
 def save_config(config: WonderConfig) -> Path:
@@ -107,6 +151,17 @@ def save_config(config: WonderConfig) -> Path:
     config.ensure_valid()
     path = config_path()
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fp:
-        json.dump(config.to_dict(), fp, indent=2, sort_keys=True)
+    payload = _dumps(config.to_dict())
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        if os.getenv(ENV_FSYNC) == "1":
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    # Do not rely on the new mtime alone: a rewrite within the clock's resolution keeps it.
+    _read_config.cache_clear()
     return path
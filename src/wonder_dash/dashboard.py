@@ -3,41 +3,28 @@
 from __future__ import annotations
 
 import os
-import select
+import selectors
 import sys
+import threading
 import time
+from array import array
+from collections import deque
+from concurrent.futures import Future
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, partial
 from datetime import datetime, timedelta, timezone
-from statistics import fmean
-from typing import Dict, List, Optional
+from math import fsum
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 from .config import WonderConfig
 
-try:
+if TYPE_CHECKING:  # pragma: no cover - annotations only
     import boto3
-    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, ProfileNotFound
-except ModuleNotFoundError as exc:  # pragma: no cover - informative guard
-    print(
-        "WonderDash dashboard requires boto3. Install it with `pip install boto3`.",
-        file=sys.stderr,
-    )
-    raise SystemExit(1) from exc
-
-try:
-    from rich.console import Console
     from rich.layout import Layout
     from rich.live import Live
     from rich.panel import Panel
-    from rich.spinner import Spinner
-    from rich.table import Table
     from rich.text import Text
-except ModuleNotFoundError as exc:  # pragma: no cover - informative guard
-    print(
-        "WonderDash dashboard requires the 'rich' package. Install it with `pip install rich`.",
-        file=sys.stderr,
-    )
-    raise SystemExit(1) from exc
 
 try:  # pragma: no cover - UNIX-only
     import termios
@@ -51,37 +38,64 @@ try:  # pragma: no cover - Windows-only
 except ModuleNotFoundError:  # pragma: no cover - non-Windows
     msvcrt = None  # type: ignore[assignment]
 
-console = Console()
 
-
-@dataclass(frozen=True)
-class MetricSample:
-    timestamp: datetime
-    value: float
+HISTORY_LENGTH = 30
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
 
 
 @dataclass(frozen=True)
 class MetricWindow:
-    samples: List[MetricSample]
     status: str
     messages: List[str]
+    timestamps: List[datetime] = field(default_factory=list)
+    # Float columns are array("d"): C doubles, filled without per-item Python objects.
+    values: Sequence[float] = field(default_factory=partial(array, "d"))
+
+    @cached_property
+    def total(self) -> float:
+        # Request counts are whole numbers, so the C-level builtin sum is already exact.
+        return sum(self.values)
+
+    @cached_property
+    def history_rows(self) -> List[Tuple[str, str, str]]:
+        """Formatted (time, requests, spark) cells for the most recent periods."""
+        tail_values = self.values[-HISTORY_LENGTH:]
+        if not tail_values:
+            return []
+        top = len(SPARK_BLOCKS) - 1
+        max_val = max(tail_values) or 1.0
+        return [
+            (
+                timestamp.strftime("%H:%M"),
+                f"{value:,.0f}",
+                SPARK_BLOCKS[min(int((value / max_val) * top), top)],
+            )
+            for timestamp, value in zip(self.timestamps[-HISTORY_LENGTH:], tail_values)
+        ]
 
 
 @dataclass(frozen=True)
 class ScalarMetric:
     label: str
     unit: str
-    values: List[float]
+    values: Sequence[float]
     timestamps: List[datetime]
 
     @property
     def latest(self) -> float:
         return self.values[-1] if self.values else 0.0
 
-    @property
+    # Windows only change on a fetch, so aggregates are computed once per instance
+    # rather than on every redraw.
+    @cached_property
     def total(self) -> float:
         return sum(self.values)
 
+    @cached_property
+    def mean(self) -> float:
+        # fsum matches statistics.fmean's accuracy without its per-call overhead.
+        return fsum(self.values) / len(self.values) if self.values else 0.0
+
 
 @dataclass(frozen=True)
 class HealthStatus:
@@ -91,7 +105,50 @@ class HealthStatus:
     badge: str
 
 
+@dataclass(frozen=True)
+class MetricSpec:
+    id: str
+    metric: str
+    stat: str
+    unit: str
+    label: str
+
+
+REQUESTS_METRIC_ID = "requests"
+
+CLOUDFRONT_METRICS: Tuple[MetricSpec, ...] = (
+    MetricSpec(REQUESTS_METRIC_ID, "Requests", "Sum", "Count", "Requests"),
+    MetricSpec("bytes_downloaded", "BytesDownloaded", "Sum", "Bytes", "Bytes Downloaded"),
+    MetricSpec("bytes_uploaded", "BytesUploaded", "Sum", "Bytes", "Bytes Uploaded"),
+    MetricSpec("errors_4xx", "4xxErrorRate", "Average", "Percent", "4xx Error Rate"),
+    MetricSpec("errors_5xx", "5xxErrorRate", "Average", "Percent", "5xx Error Rate"),
+    MetricSpec("total_errors", "TotalErrorRate", "Average", "Percent", "Total Error Rate"),
+    MetricSpec("origin_latency", "OriginLatency", "Average", "Milliseconds", "Origin Latency"),
+    MetricSpec("availability", "Availability", "Average", "Percent", "Availability"),
+    MetricSpec("cache_hit", "CacheHitRate", "Average", "Percent", "Cache Hit Rate"),
+)
+
+
+@dataclass
+class LayoutCache:
+    """Window-derived panels and layout reused while only the refresh countdown changes."""
+
+    window: Optional[MetricWindow] = None
+    panels: Tuple[Panel, ...] = ()
+    status_message: str = ""
+    header: Optional[Panel] = None
+    layout: Optional[Layout] = None
+    # (message, countdown in whole seconds, poll interval) the status panel was built for.
+    status_key: Optional[Tuple[str, int, int]] = None
+    status_panel: Optional[Panel] = None
+    # Scalar metrics the metrics panel was built from; held so identity checks stay valid.
+    metrics_source: Tuple[ScalarMetric, ...] = ()
+    metrics_panel: Optional[Panel] = None
+
+
 def _session_from_config(config: WonderConfig) -> boto3.Session:
+    import boto3
+
     kwargs = {}
     if config.aws_profile:
         kwargs["profile_name"] = config.aws_profile
@@ -99,8 +156,22 @@ def _session_from_config(config: WonderConfig) -> boto3.Session:
 
 
 def _cloudwatch_client(config: WonderConfig):
+    from botocore.config import Config
+
     session = _session_from_config(config)
-    return session.client("cloudwatch", region_name=config.region)
+    # One client serves every poll; keep its single connection alive between polls.
+    # Recent botocore releases already negotiate CloudWatch's CBOR protocol, which keeps
+    # decoding cheap.
+    # Short timeouts keep a stalled connection from holding a poll for botocore's 60s
+    # default; adaptive retries absorb throttling within the same poll.
+    client_config = Config(
+        max_pool_connections=2,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        connect_timeout=3,
+        read_timeout=5,
+        tcp_keepalive=True,
+    )
+    return session.client("cloudwatch", region_name=config.region, config=client_config)
 
 
 def _env_int(name: str, default: int) -> int:
@@ -131,143 +202,168 @@ def _inject_overrides(config: WonderConfig) -> WonderConfig:
     return copy
 
 
-def fetch_request_series(
+# GetMetricData accepts at most 500 queries per request.
+MAX_QUERIES_PER_CALL = 500
+# MaxDatapoints requested per GetMetricData page.
+METRIC_PAGE_SIZE = 1000
+
+
+def _query_id(index: int, spec_id: str) -> str:
+    # Query ids must start with a lowercase letter, so prefix the distribution index.
+    return f"d{index}_{spec_id}"
+
+
+@lru_cache(maxsize=8)
+def _build_queries(
+    distribution_ids: Tuple[str, ...],
+    period_seconds: int,
+    specs: Tuple[MetricSpec, ...],
+) -> Tuple[Dict[str, Any], ...]:
+    """MetricDataQueries for every (distribution, spec) pair; fixed per session, so built once."""
+    return tuple(
+        {
+            "Id": _query_id(index, spec.id),
+            "MetricStat": {
+                "Metric": {
+                    "Namespace": "AWS/CloudFront",
+                    "MetricName": spec.metric,
+                    "Dimensions": [
+                        {"Name": "DistributionId", "Value": distribution_id},
+                        {"Name": "Region", "Value": "Global"},
+                    ],
+                },
+                "Period": period_seconds,
+                "Stat": spec.stat,
+            },
+            "ReturnData": True,
+        }
+        for index, distribution_id in enumerate(distribution_ids)
+        for spec in specs
+    )
+
+
+def _metric_data_results(client, queries: Sequence[Dict[str, Any]], start: datetime, end: datetime):
+    """Yield MetricDataResults, splitting at the query limit and streaming pages as they arrive.
+
+    Every page is consumed: the overview totals and health checks cover the whole window,
+    so stopping early would under-report. Short windows still finish in a single call.
+    """
+    paginator = client.get_paginator("get_metric_data")
+    for offset in range(0, len(queries), MAX_QUERIES_PER_CALL):
+        pages = paginator.paginate(
+            MetricDataQueries=queries[offset : offset + MAX_QUERIES_PER_CALL],
+            StartTime=start,
+            EndTime=end,
+            ScanBy="TimestampAscending",
+            PaginationConfig={"PageSize": METRIC_PAGE_SIZE},
+        )
+        for page in pages:
+            yield from page.get("MetricDataResults", [])
+
+
+def fetch_distribution_series(
     client,
-    distribution_id: str,
+    distribution_ids: Sequence[str],
     period_seconds: int,
     window_minutes: int,
     *,
-    scalars: Optional[Dict[str, ScalarMetric]] = None,
-) -> MetricWindow:
+    specs: Sequence[MetricSpec] = CLOUDFRONT_METRICS,
+) -> Dict[str, Tuple[MetricWindow, Dict[str, ScalarMetric]]]:
+    """Fetch ``specs`` for several distributions with as few GetMetricData calls as possible."""
     end = datetime.now(timezone.utc) - timedelta(seconds=period_seconds)
     start = end - timedelta(minutes=window_minutes)
 
-    metric_specs = {
-        "requests": {"metric": "Requests", "stat": "Sum", "unit": "Count", "label": "Requests"},
-        "bytes_downloaded": {
-            "metric": "BytesDownloaded",
-            "stat": "Sum",
-            "unit": "Bytes",
-            "label": "Bytes Downloaded",
-        },
-        "bytes_uploaded": {
-            "metric": "BytesUploaded",
-            "stat": "Sum",
-            "unit": "Bytes",
-            "label": "Bytes Uploaded",
-        },
-        "errors_4xx": {
-            "metric": "4xxErrorRate",
-            "stat": "Average",
-            "unit": "Percent",
-            "label": "4xx Error Rate",
-        },
-        "errors_5xx": {
-            "metric": "5xxErrorRate",
-            "stat": "Average",
-            "unit": "Percent",
-            "label": "5xx Error Rate",
-        },
-        "total_errors": {
-            "metric": "TotalErrorRate",
-            "stat": "Average",
-            "unit": "Percent",
-            "label": "Total Error Rate",
-        },
-        "origin_latency": {
-            "metric": "OriginLatency",
-            "stat": "Average",
-            "unit": "Milliseconds",
-            "label": "Origin Latency",
-        },
-        "availability": {
-            "metric": "Availability",
-            "stat": "Average",
-            "unit": "Percent",
-            "label": "Availability",
-        },
-        "cache_hit": {
-            "metric": "CacheHitRate",
-            "stat": "Average",
-            "unit": "Percent",
-            "label": "Cache Hit Rate",
-        },
-    }
-
-    queries = []
-    for key, spec in metric_specs.items():
-        queries.append(
-            {
-                "Id": key,
-                "MetricStat": {
-                    "Metric": {
-                        "Namespace": "AWS/CloudFront",
-                        "MetricName": spec["metric"],
-                        "Dimensions": [
-                            {"Name": "DistributionId", "Value": distribution_id},
-                            {"Name": "Region", "Value": "Global"},
-                        ],
-                    },
-                    "Period": period_seconds,
-                    "Stat": spec["stat"],
-                },
-                "ReturnData": True,
-            }
-        )
-
-    response = client.get_metric_data(
-        MetricDataQueries=queries,
-        StartTime=start,
-        EndTime=end,
-        ScanBy="TimestampAscending",
-        MaxDatapoints=1000,
-    )
+    distribution_ids = tuple(distribution_ids)
+    specs = tuple(specs)
+    queries = _build_queries(distribution_ids, period_seconds, specs)
 
-    results = response.get("MetricDataResults", [])
-    if not results:
-        if scalars is not None:
-            scalars.clear()
-        return MetricWindow(samples=[], status="NoData", messages=[])
-
-    samples: List[MetricSample] = []
-    scalar_store: Dict[str, ScalarMetric] = {}
-    status = "Unknown"
-    messages: List[str] = []
-
-    for result in results:
-        metric_id = result.get("Id", "")
-        timestamps = [
-            datetime.fromisoformat(ts.replace("Z", "+00:00")) if isinstance(ts, str) else ts
-            for ts in result.get("Timestamps", [])
-        ]
-        values = [float(v) for v in result.get("Values", [])]
-        status = result.get("StatusCode", status)
+    columns: Dict[Tuple[int, str], Tuple[List[datetime], array]] = {}
+    statuses: Dict[int, str] = {}
+    messages: Dict[int, List[str]] = {}
 
+    for result in _metric_data_results(client, queries, start, end):
+        prefix, _, metric_id = result.get("Id", "").partition("_")
+        try:
+            index = int(prefix[1:])
+        except ValueError:
+            continue
+        # Read-only: the column below copies it via extend().
+        timestamps = result.get("Timestamps") or ()
+        # boto3 returns datetimes; only raw/stubbed responses carry ISO strings.
+        if timestamps and isinstance(timestamps[0], str):
+            timestamps = [datetime.fromisoformat(ts.replace("Z", "+00:00")) for ts in timestamps]
+        statuses[index] = result.get("StatusCode", statuses.get(index, "Unknown"))
+
+        notes = messages.setdefault(index, [])
         for entry in result.get("Messages") or []:
             if isinstance(entry, dict):
                 code = entry.get("Code") or "Message"
                 value = entry.get("Value") or ""
-                messages.append(f"{code}: {value}".strip())
+                notes.append(f"{code}: {value}".strip())
             else:
-                messages.append(str(entry))
+                notes.append(str(entry))
 
-        if metric_id == "requests":
-            samples.extend(MetricSample(timestamp=ts, value=val) for ts, val in zip(timestamps, values))
-        else:
-            spec = metric_specs.get(metric_id)
-            if spec:
-                scalar_store[metric_id] = ScalarMetric(
-                    label=spec.get("label", metric_id.replace("_", " ").title()),
-                    unit=spec["unit"],
-                    values=values,
-                    timestamps=timestamps,
-                )
+        # Paginated responses continue a series, so extend rather than replace.
+        times_column, values_column = columns.setdefault((index, metric_id), ([], array("d")))
+        times_column.extend(timestamps)
+        values_column.extend(result.get("Values") or ())
+
+    series: Dict[str, Tuple[MetricWindow, Dict[str, ScalarMetric]]] = {}
+    for index, distribution_id in enumerate(distribution_ids):
+        if index not in statuses:
+            series[distribution_id] = (MetricWindow(status="NoData", messages=[]), {})
+            continue
 
-    samples.sort(key=lambda sample: sample.timestamp)
+        request_times, request_values = columns.get((index, REQUESTS_METRIC_ID), ([], array("d")))
+        # ScanBy=TimestampAscending already orders the series; the endpoint check only guards
+        # against responses that ignored it (e.g. hand-built or replayed payloads).
+        if request_times and request_times[0] > request_times[-1]:
+            ordered = sorted(zip(request_times, request_values))
+            request_times = [ts for ts, _ in ordered]
+            request_values = array("d", (val for _, val in ordered))
+
+        scalar_store: Dict[str, ScalarMetric] = {}
+        for spec in specs:
+            if spec.id == REQUESTS_METRIC_ID or (index, spec.id) not in columns:
+                continue
+            times_column, values_column = columns[(index, spec.id)]
+            scalar_store[spec.id] = ScalarMetric(
+                label=spec.label,
+                unit=spec.unit,
+                values=values_column,
+                timestamps=times_column,
+            )
+
+        window = MetricWindow(
+            status=statuses[index],
+            messages=messages.get(index, []),
+            timestamps=request_times,
+            values=request_values,
+        )
+        series[distribution_id] = (window, scalar_store)
+    return series
+
+
+def fetch_request_series(
+    client,
+    distribution_id: str,
+    period_seconds: int,
+    window_minutes: int,
+    *,
+    scalars: Optional[Dict[str, ScalarMetric]] = None,
+    specs: Sequence[MetricSpec] = CLOUDFRONT_METRICS,
+) -> MetricWindow:
+    window, scalar_store = fetch_distribution_series(
+        client,
+        [distribution_id],
+        period_seconds,
+        window_minutes,
+        specs=specs,
+    )[distribution_id]
     if scalars is not None:
         scalars.clear()
         scalars.update(scalar_store)
-    return MetricWindow(samples=samples, status=status, messages=messages)
+    return window
 
 
 def build_layout(
@@ -279,33 +375,75 @@ def build_layout(
     *,
     header: Panel,
     scalars: Optional[Dict[str, ScalarMetric]] = None,
+    cache: Optional[LayoutCache] = None,
+    now: Optional[datetime] = None,
 ) -> Layout:
-    samples = list(window.samples)
-    overview_panel = _overview_panel(samples, period_seconds)
-    history_panel = _history_panel(samples)
-    metrics_panel = _metrics_panel(scalars or {})
-    recent_panel = _recent_panel(samples)
-    status_lines = [f"Metric status: {window.status or 'Unknown'}"]
-    if not samples and window.status not in {"CloudWatchError", "CredentialsMissing"}:
-        status_lines.append(
-            "No datapoints in window. CloudFront metrics can lag by ~5 minutes—"
-            "generate traffic or widen the window."
-        )
-    if window.messages:
-        status_lines.extend(window.messages)
+    from rich.layout import Layout
+
+    if cache is not None and cache.window is window:
+        overview_panel, recent_panel, history_panel, metrics_panel = cache.panels
+        status_message = cache.status_message
+    else:
+        overview_panel = _overview_panel(window, period_seconds)
+        history_panel = _history_panel(window.history_rows)
+        metrics_source = tuple((scalars or {}).values())
+        if (
+            cache is not None
+            and cache.metrics_panel is not None
+            and len(metrics_source) == len(cache.metrics_source)
+            and all(new is old for new, old in zip(metrics_source, cache.metrics_source))
+        ):
+            # Same ScalarMetric objects (e.g. repeated errors): reuse the panel.
+            metrics_panel = cache.metrics_panel
+        else:
+            metrics_panel = _metrics_panel(scalars or {})
+            if cache is not None:
+                cache.metrics_source = metrics_source
+                cache.metrics_panel = metrics_panel
+        recent_panel = _recent_panel(window)
+        status_lines = [f"Metric status: {window.status or 'Unknown'}"]
+        if not window.values and window.status not in {"CloudWatchError", "CredentialsMissing"}:
+            status_lines.append(
+                "No datapoints in window. CloudFront metrics can lag by ~5 minutes—"
+                "generate traffic or widen the window."
+            )
+        if window.messages:
+            status_lines.extend(window.messages)
+        status_message = "\n".join(filter(None, status_lines))
+        if cache is not None:
+            cache.window = window
+            cache.panels = (overview_panel, recent_panel, history_panel, metrics_panel)
+            cache.status_message = status_message
 
     if remaining_seconds is None:
         if last_refresh is not None:
-            elapsed = (datetime.now(timezone.utc) - last_refresh).total_seconds()
+            elapsed = ((now or datetime.now(timezone.utc)) - last_refresh).total_seconds()
             remaining_seconds = max(0.0, poll_seconds - elapsed)
         else:
             remaining_seconds = float(poll_seconds)
 
-    status_panel = _status_panel(
-        "\n".join(filter(None, status_lines)),
-        remaining_seconds=remaining_seconds,
-        poll_seconds=poll_seconds,
-    )
+    # The countdown is shown in whole seconds, matching the once-per-second redraws, so
+    # ticks within the same second reuse the panel.
+    status_key = (status_message, int(max(0.0, remaining_seconds)), poll_seconds)
+    if cache is not None and cache.status_key == status_key and cache.status_panel is not None:
+        status_panel = cache.status_panel
+        status_changed = False
+    else:
+        status_panel = _status_panel(
+            status_message,
+            remaining_seconds=remaining_seconds,
+            poll_seconds=poll_seconds,
+        )
+        status_changed = True
+        if cache is not None:
+            cache.status_key = status_key
+            cache.status_panel = status_panel
+
+    if cache is not None and cache.layout is not None and cache.header is header and cache.window is window:
+        # Countdown tick: swap the status panel into the existing layout tree.
+        if status_changed:
+            cache.layout["status"].update(status_panel)
+        return cache.layout
 
     layout = Layout(name="root")
     layout.split_column(
@@ -316,17 +454,25 @@ def build_layout(
         Layout(metrics_panel, name="metrics", size=9),
         Layout(status_panel, name="status", size=7),
     )
+    if cache is not None:
+        cache.header = header
+        cache.layout = layout
     return layout
 
 
-def _overview_panel(samples: List[MetricSample], period_seconds: int) -> Panel:
+def _overview_panel(window: MetricWindow, period_seconds: int) -> Panel:
+    from rich.panel import Panel
+    from rich.table import Table
+
     table = Table.grid(expand=True)
     table.add_column(justify="left")
     table.add_column(justify="right")
 
-    datapoints = len(samples)
-    total_requests = sum(sample.value for sample in samples)
-    latest = samples[-1].value if samples else 0.0
+    timestamps = window.timestamps
+    values = window.values
+    datapoints = len(values)
+    total_requests = window.total
+    latest = values[-1] if values else 0.0
 
     window_minutes = max(datapoints, 1) * (period_seconds / 60)
     per_minute = total_requests / window_minutes if window_minutes else 0.0
@@ -338,9 +484,9 @@ def _overview_panel(samples: List[MetricSample], period_seconds: int) -> Panel:
     table.add_row("Requests / minute", f"{per_minute:,.2f}")
     table.add_row("Requests / hour", f"{per_hour:,.0f}")
 
-    if samples:
-        first_ts = samples[0].timestamp.astimezone(timezone.utc)
-        last_ts = samples[-1].timestamp.astimezone(timezone.utc)
+    if timestamps:
+        first_ts = timestamps[0].astimezone(timezone.utc)
+        last_ts = timestamps[-1].astimezone(timezone.utc)
         table.add_row("Window start (UTC)", first_ts.strftime("%Y-%m-%d %H:%M:%S"))
         table.add_row("Window end (UTC)", last_ts.strftime("%Y-%m-%d %H:%M:%S"))
     else:
@@ -350,16 +496,20 @@ def _overview_panel(samples: List[MetricSample], period_seconds: int) -> Panel:
     return Panel(table, title="CloudFront Requests", border_style="cyan")
 
 
+_BYTE_UNITS = ("Bytes", "KB", "MB", "GB", "TB")
+
+
 def _format_bytes(value: float) -> str:
-    units = ["Bytes", "KB", "MB", "GB", "TB"]
-    for unit in units:
-        if value < 1024 or unit == units[-1]:
-            return f"{value:,.2f} {unit}"
-        value /= 1024
-    return f"{value:,.2f} Bytes"
+    # Each unit spans 10 bits, so the integer bit length picks the unit without a division loop.
+    exponent = min(len(_BYTE_UNITS) - 1, max(0, (int(value).bit_length() - 1) // 10))
+    return f"{value / (1 << (exponent * 10)):,.2f} {_BYTE_UNITS[exponent]}"
 
 
 def _metrics_panel(metrics: Dict[str, ScalarMetric]) -> Panel:
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table.grid(expand=True)
     table.add_column(justify="left")
     table.add_column(justify="right")
@@ -389,13 +539,11 @@ def _metrics_panel(metrics: Dict[str, ScalarMetric]) -> Panel:
                 add_row(f"{bullet}{metric.label} (latest)", _format_bytes(metric.latest))
                 add_row("  Window total", _format_bytes(metric.total))
             elif metric.unit == "Milliseconds":
-                avg = fmean(metric.values) if metric.values else 0.0
                 add_row(f"{bullet}{metric.label}", f"{metric.latest:,.0f} ms")
-                add_row("  Window avg", f"{avg:,.0f} ms")
+                add_row("  Window avg", f"{metric.mean:,.0f} ms")
             elif metric.unit == "Percent":
-                avg = fmean(metric.values) if metric.values else 0.0
                 add_row(f"{bullet}{metric.label}", f"{metric.latest:,.2f}%")
-                add_row("  Window avg", f"{avg:,.2f}%")
+                add_row("  Window avg", f"{metric.mean:,.2f}%")
             else:
                 add_row(f"{bullet}{metric.label}", f"{metric.latest:,.2f}")
                 add_row("  Window total", f"{metric.total:,.2f}")
@@ -404,49 +552,43 @@ def _metrics_panel(metrics: Dict[str, ScalarMetric]) -> Panel:
     return Panel(table, title="Additional Metrics", border_style="blue")
 
 
-def _history_panel(samples: List[MetricSample]) -> Panel:
-    chart = Table(show_header=False, box=None, expand=True, padding=(0, 1))
-    chart.add_column("Time", justify="left", no_wrap=True)
-    chart.add_column("Requests", justify="right")
-    chart.add_column("Spark", justify="left")
-
-    tail = samples[-30:]
-    blocks = "▁▂▃▄▅▆▇█"
+def _history_panel(rows: List[Tuple[str, str, str]]) -> Panel:
+    from rich.panel import Panel
+    from rich.text import Text
 
-    if tail:
-        max_val = max(sample.value for sample in tail) or 1.0
-        for sample in tail:
-            block_index = min(int((sample.value / max_val) * (len(blocks) - 1)), len(blocks) - 1)
-            chart.add_row(
-                sample.timestamp.strftime("%H:%M"),
-                f"{sample.value:,.0f}",
-                blocks[block_index],
-            )
-    else:
+    if not rows:
         return Panel(
             "Waiting for datapoints… CloudFront metrics trail by a few minutes.",
             title="Recent Periods",
             border_style="magenta",
         )
 
-    return Panel(chart, title="Recent Periods", border_style="magenta")
+    # One pre-joined Text instead of a three-column Table keeps this to a single renderable.
+    width = max(len(count) for _, count, _ in rows)
+    body = "\n".join(f"{hhmm}  {count:>{width}}  {spark}" for hhmm, count, spark in rows)
+    return Panel(Text(body, no_wrap=True), title="Recent Periods", border_style="magenta")
 
 
-def _recent_panel(samples: List[MetricSample]) -> Panel:
+def _recent_panel(window: MetricWindow) -> Panel:
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table.grid(expand=True)
     table.add_column(justify="left")
     table.add_column(justify="right")
 
-    if not samples:
+    values = window.values
+    if not values:
         table.add_row("Latest", "—")
         table.add_row("Change", "—")
         table.add_row("Window avg", "—")
         return Panel(table, title="Request Snapshots", border_style="green")
 
-    latest = samples[-1].value
-    prev = samples[-2].value if len(samples) > 1 else 0.0
+    latest = values[-1]
+    prev = values[-2] if len(values) > 1 else 0.0
     change = latest - prev
-    avg = sum(s.value for s in samples) / len(samples)
+    avg = window.total / len(values)
 
     if change > 0:
         change_symbol = "+"
@@ -464,8 +606,8 @@ def _recent_panel(samples: List[MetricSample]) -> Panel:
     return Panel(table, title="Request Snapshots", border_style="green")
 
 
-def _compute_health(metrics: Dict[str, ScalarMetric], samples: List[MetricSample]) -> HealthStatus:
-    if not metrics and not samples:
+def _compute_health(metrics: Dict[str, ScalarMetric], values: Sequence[float]) -> HealthStatus:
+    if not metrics and not values:
         return HealthStatus("Monitoring", "Waiting for metrics", "yellow", badge="? Monitoring")
 
     severity = 0
@@ -520,12 +662,31 @@ def _compute_health(metrics: Dict[str, ScalarMetric], samples: List[MetricSample
     return HealthStatus(label, detail, style, badge)
 
 
+@lru_cache(maxsize=8)
+def _badge_text(badge: str, label: str, style: str) -> Text:
+    """Health badge text; only a handful of combinations exist, so each is built once."""
+    from rich.text import Text
+
+    return Text(f"{badge} {label}", style=f"bold {style}")
+
+
+@lru_cache(maxsize=1)
+def _hint_text() -> Text:
+    from rich.text import Text
+
+    return Text("Press Q to exit • Ctrl+C to abort", style="dim")
+
+
 def _header_panel(config: WonderConfig, health: HealthStatus, window: MetricWindow) -> Panel:
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     grid = Table.grid(expand=True)
     grid.add_column(ratio=1)
     grid.add_column(ratio=1, justify="right")
 
-    grid.add_row(Text(f"{health.badge} {health.label}", style=f"bold {health.style}"), Text(health.detail or ""))
+    grid.add_row(_badge_text(health.badge, health.label, health.style), Text(health.detail or ""))
     grid.add_row(
         f"Distribution: {config.distribution_id or '—'}",
         f"Region: {config.region}",
@@ -534,10 +695,10 @@ def _header_panel(config: WonderConfig, health: HealthStatus, window: MetricWind
         f"Period: {config.period_seconds}s",
         f"Window: {config.window_minutes}m",
     )
-    if window.samples:
+    if window.timestamps:
         grid.add_row(
-            f"Last datapoint: {window.samples[-1].timestamp.astimezone(timezone.utc).strftime('%H:%M:%S UTC')}",
-            f"Points: {len(window.samples)}",
+            f"Last datapoint: {window.timestamps[-1].astimezone(timezone.utc).strftime('%H:%M:%S UTC')}",
+            f"Points: {len(window.timestamps)}",
         )
 
     return Panel(grid, border_style=health.style, title="WonderDash")
@@ -549,59 +710,132 @@ def _status_panel(
     remaining_seconds: float,
     poll_seconds: int,
 ) -> Panel:
+    from rich.panel import Panel
+    from rich.spinner import Spinner
+    from rich.table import Table
+    from rich.text import Text
+
     grid = Table.grid(expand=True)
     remaining_display = max(0.0, remaining_seconds)
     if remaining_display == poll_seconds:
         spinner_text = f"Polling CloudWatch… interval {poll_seconds}s"
     else:
-        spinner_text = f"Polling CloudWatch… next refresh in {remaining_display:0.1f}s"
+        spinner_text = f"Polling CloudWatch… next refresh in {int(remaining_display)}s"
     grid.add_row(Spinner("dots", text=spinner_text))
 
     message = message.strip()
     if message:
         grid.add_row(Text(message))
 
-    grid.add_row(Text("Press Q to exit • Ctrl+C to abort", style="dim"))
+    grid.add_row(_hint_text())
     return Panel(grid, title="Status", border_style="yellow")
 
 
 EXIT_KEYS = {"q", "Q"}
+# Console input cannot be select()ed on Windows, so kbhit() is sampled at this step.
+KBHIT_POLL_SECONDS = 0.25
+# How often the exit key is checked while a fetch is in flight.
+FETCH_KEY_POLL_SECONDS = 0.1
+# Most recent poll errors replayed when the dashboard exits.
+ERROR_LOG_LENGTH = 20
+
+
+class KeyReader:
+    """Single-key reader that keeps the terminal in cbreak mode while it is open.
+
+    Terminal mode is switched once on enter and restored on exit, and stdin is
+    registered with one selector (epoll/kqueue where available), so each wait is
+    a single ``select`` call.
+    """
+
+    def __init__(self) -> None:
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._fd: Optional[int] = None
+        self._old_settings = None
+
+    def __enter__(self) -> KeyReader:
+        if msvcrt or termios is None or tty is None or not sys.stdin.isatty():  # pragma: no cover
+            return self
+        fd = sys.stdin.fileno()
+        try:
+            self._old_settings = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        except termios.error:  # pragma: no cover
+            return self
+        self._fd = fd
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(fd, selectors.EVENT_READ)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._fd is not None:
+            with suppress(termios.error):
+                termios.tcsetattr(self._fd, termios.TCSADRAIN, self._old_settings)
+            self._fd = None
 
+    @property
+    def active(self) -> bool:
+        """True when keys can be read one at a time (cbreak mode, or the Windows console)."""
+        return bool(msvcrt) or self._selector is not None
 
-def _read_single_key(timeout: float) -> Optional[str]:
-    if timeout <= 0:
-        timeout = 0
+    def read(self, timeout: float) -> Optional[str]:
+        if timeout <= 0:
+            timeout = 0
 
-    if msvcrt:  # pragma: no cover - Windows
-        end_time = time.monotonic() + timeout
-        while time.monotonic() < end_time:
-            if msvcrt.kbhit():
-                return msvcrt.getwch()
-            time.sleep(0.05)
-        return None
+        if msvcrt:  # pragma: no cover - Windows
+            end_time = time.monotonic() + timeout
+            while True:
+                if msvcrt.kbhit():
+                    return msvcrt.getwch()
+                left = end_time - time.monotonic()
+                if left <= 0:
+                    return None
+                time.sleep(min(KBHIT_POLL_SECONDS, left))
 
-    if termios is None or tty is None or not sys.stdin.isatty():  # pragma: no cover
-        time.sleep(timeout)
-        return None
+        if self._selector is None:  # pragma: no cover - not a TTY
+            time.sleep(timeout)
+            return None
 
-    fd = sys.stdin.fileno()
-    try:
-        old_settings = termios.tcgetattr(fd)
-    except termios.error:  # pragma: no cover
-        time.sleep(timeout)
+        try:
+            if self._selector.select(timeout):
+                return sys.stdin.read(1)
+        except OSError:  # pragma: no cover
+            return None
         return None
 
-    try:
-        tty.setcbreak(fd)
-        rlist, _, _ = select.select([sys.stdin], [], [], timeout)
-        if rlist:
-            return sys.stdin.read(1)
-    except (OSError, termios.error):  # pragma: no cover
-        return None
-    finally:
-        with suppress(termios.error):
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return None
+
+def submit_daemon(fn: Callable[..., Any], *, name: str, **kwargs: Any) -> Future:
+    """Run ``fn(**kwargs)`` on a daemon thread and return a Future for its result.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so quitting would wait out an
+    in-flight AWS call and its retries; a daemon thread is simply abandoned.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(**kwargs)
+        except BaseException as exc:  # handed to whoever reads the future
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+def _await_fetch(future: Future, keys: KeyReader) -> bool:
+    """Watch for the exit key until the background fetch settles; True means exit."""
+    while not future.done():
+        key = keys.read(FETCH_KEY_POLL_SECONDS)
+        if key and key in EXIT_KEYS:
+            return True
+    return False
 
 
 def _wait_for_next_poll(
@@ -613,16 +847,27 @@ def _wait_for_next_poll(
     *,
     header: Panel,
     scalars: Optional[Dict[str, ScalarMetric]] = None,
+    cache: Optional[LayoutCache] = None,
+    keys: KeyReader,
 ) -> bool:
     deadline = time.monotonic() + poll_seconds
+    remaining = float(poll_seconds)
+    drawn_second = int(remaining)
     while True:
+        # One clock read per tick drives both the exit check and the countdown display.
+        # Wake when the countdown crosses its next whole second, so every redraw shows a new value.
+        key = keys.read(max(0.1, remaining % 1.0 or 1.0))
+        if key and key in EXIT_KEYS:
+            return True
+
         remaining = deadline - time.monotonic()
         if remaining <= 0:
             return False
-
-        key = _read_single_key(min(0.5, max(0.05, remaining)))
-        if key and key in EXIT_KEYS:
-            return True
+        # Dirty check: the window is fixed for this wait, so only a new countdown second needs a redraw
+        # (a stray key can wake us early within the same second).
+        if int(remaining) == drawn_second:
+            continue
+        drawn_second = int(remaining)
 
         live.update(
             build_layout(
@@ -633,6 +878,7 @@ def _wait_for_next_poll(
                 remaining_seconds=remaining,
                 header=header,
                 scalars=scalars,
+                cache=cache,
             ),
             refresh=True,
         )
@@ -640,28 +886,55 @@ def _wait_for_next_poll(
 
 def run_dashboard(config: WonderConfig) -> None:
     if not config.distribution_id:
-        console.print(
-            "[red]No CloudFront distribution configured.[/red] "
-            "Run `wonder-dash setup` first to capture settings."
+        print(
+            "No CloudFront distribution configured. "
+            "Run `wonder-dash setup` first to capture settings.",
+            file=sys.stderr,
         )
         raise SystemExit(1)
 
+    try:
+        from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, ProfileNotFound
+    except ModuleNotFoundError as exc:  # pragma: no cover - informative guard
+        print(
+            "WonderDash dashboard requires boto3. Install it with `pip install boto3`.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1) from exc
+
+    try:
+        from rich.console import Console
+        from rich.live import Live
+        from rich.text import Text
+    except ModuleNotFoundError as exc:  # pragma: no cover - informative guard
+        print(
+            "WonderDash dashboard requires the 'rich' package. Install it with `pip install rich`.",
+            file=sys.stderr,
+        )
+        raise SystemExit(1) from exc
+
+    console = Console()
+
     config = _inject_overrides(config)
     client = _cloudwatch_client(config)
-    refresh_hz = max(1, min(10, 60 // max(1, config.poll_seconds // 2)))
 
     window = MetricWindow(
-        samples=[],
         status="Init",
         messages=[f"Watching distribution {config.distribution_id}"],
     )
     last_refresh: Optional[datetime] = None
     scalars: Dict[str, ScalarMetric] = {}
+    layout_cache = LayoutCache()
+    # Poll errors already show in the status panel; the log is kept here and printed once
+    # after Live stops, so a throttling storm does not write to the terminal on every poll.
+    error_log: Deque[str] = deque(maxlen=ERROR_LOG_LENGTH)
 
-    health = _compute_health(scalars, window.samples)
+    health = _compute_health(scalars, window.values)
     header = _header_panel(config, health, window)
 
-    with Live(console=console, refresh_per_second=refresh_hz, screen=False) as live:
+    # Every content change is pushed explicitly with refresh=True (at most once per countdown
+    # second), so the background auto-refresh would only repaint identical frames to the TTY.
+    with KeyReader() as keys, Live(console=console, auto_refresh=False, screen=False) as live:
         live.update(
             build_layout(
                 window,
@@ -670,34 +943,43 @@ def run_dashboard(config: WonderConfig) -> None:
                 config.poll_seconds,
                 header=header,
                 scalars=scalars,
+                cache=layout_cache,
             ),
             refresh=True,
         )
 
+        # CloudWatch calls run on a daemon thread so the exit key stays live while one is in
+        # flight and quitting does not wait for it. The thread fills its own scalars dict; the
+        # shared one only changes on this thread.
         try:
             while True:
+                fetched: Dict[str, ScalarMetric] = {}
+                future = submit_daemon(
+                    fetch_request_series,
+                    name="wonder-dash-fetch",
+                    client=client,
+                    distribution_id=config.distribution_id,
+                    period_seconds=config.period_seconds,
+                    window_minutes=config.window_minutes,
+                    scalars=fetched,
+                )
+                if _await_fetch(future, keys):
+                    console.print("\n[cyan]Exit requested (q).[/cyan]")
+                    break
                 try:
-                    window = fetch_request_series(
-                        client,
-                        distribution_id=config.distribution_id,
-                        period_seconds=config.period_seconds,
-                        window_minutes=config.window_minutes,
-                        scalars=scalars,
-                    )
-                    last_refresh = datetime.now(timezone.utc)
+                    window = future.result()
+                    scalars.clear()
+                    scalars.update(fetched)
                 except ProfileNotFound as error:
                     scalars.clear()
                     window = MetricWindow(
-                        samples=[],
                         status="CredentialsMissing",
                         messages=[f"AWS profile not found: {error}"],
                     )
-                    last_refresh = datetime.now(timezone.utc)
-                    console.log(f"Profile error: {error}")
+                    error_log.append(f"[{time.strftime('%H:%M:%S')}] Profile error: {error}")
                 except NoCredentialsError as error:
                     scalars.clear()
                     window = MetricWindow(
-                        samples=[],
                         status="CredentialsMissing",
                         messages=[
                             "AWS credentials not found.",
@@ -705,19 +987,17 @@ def run_dashboard(config: WonderConfig) -> None:
                             str(error),
                         ],
                     )
-                    last_refresh = datetime.now(timezone.utc)
-                    console.log(f"Credentials error: {error}")
+                    error_log.append(f"[{time.strftime('%H:%M:%S')}] Credentials error: {error}")
                 except (ClientError, BotoCoreError) as error:
                     scalars.clear()
                     window = MetricWindow(
-                        samples=[],
                         status="CloudWatchError",
                         messages=[str(error)],
                     )
-                    last_refresh = datetime.now(timezone.utc)
-                    console.log(f"CloudWatch error: {error}")
+                    error_log.append(f"[{time.strftime('%H:%M:%S')}] CloudWatch error: {error}")
+                last_refresh = datetime.now(timezone.utc)
 
-                health = _compute_health(scalars, window.samples)
+                health = _compute_health(scalars, window.values)
                 header = _header_panel(config, health, window)
 
                 live.update(
@@ -728,6 +1008,8 @@ def run_dashboard(config: WonderConfig) -> None:
                         config.poll_seconds,
                         header=header,
                         scalars=scalars,
+                        cache=layout_cache,
+                        now=last_refresh,
                     ),
                     refresh=True,
                 )
@@ -740,8 +1022,13 @@ def run_dashboard(config: WonderConfig) -> None:
                     config.poll_seconds,
                     header=header,
                     scalars=scalars,
+                    cache=layout_cache,
+                    keys=keys,
                 ):
                     console.print("\n[cyan]Exit requested (q).[/cyan]")
                     break
         except KeyboardInterrupt:
             console.print("\n[cyan]Shutting down WonderDash…[/cyan]")
+
+    if error_log:
+        console.print(Text("\n".join(error_log), style="red"))
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-import csv
-import io
+import os
+import re
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    from concurrent.futures import Future
+
+    import boto3
+    from rich.console import Console, RenderableType
+    from rich.panel import Panel
+    from rich.table import Table
 
 # imports config file
 try:  # allow running as module or script
@@ -21,21 +32,37 @@ except ImportError:  # pragma: no cover - direct script execution fallback
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from config import load_config  # type: ignore
 
-try:
-    from rich.console import Console
-    from rich.live import Live
-    from rich.panel import Panel
-    from rich.prompt import IntPrompt
-    from rich.table import Table
-    from rich.text import Text
-except ModuleNotFoundError as exc:  # pragma: no cover
-    print("WonderDash needs the 'rich' package. Install it with `pip install rich`.", file=sys.stderr)
-    raise SystemExit(1) from exc
+try:  # optional in-process clipboard access
+    import pyperclip
+except ModuleNotFoundError:  # pragma: no cover - falls back to pbcopy
+    pyperclip = None  # type: ignore[assignment]
 
 from .hub_utils import build_loading_layout, simple_table
 from .ascii_art import get_wonder_dash_logo, get_compact_logo, get_welcome_message
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _aws_errors() -> Tuple[type, ...]:
+    """botocore's ``(ClientError, BotoCoreError)``, imported on first use.
+
+    An ``except`` clause only evaluates its expression once something is raised, so
+    ``except _aws_errors():`` keeps botocore out of the hub's import path.
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    return (ClientError, BotoCoreError)
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Shared Rich console, created on first use so importing the hub probes no terminal."""
+    try:
+        from rich.console import Console
+    except ModuleNotFoundError as exc:  # pragma: no cover
+        print("WonderDash needs the 'rich' package. Install it with `pip install rich`.", file=sys.stderr)
+        raise SystemExit(1) from exc
+    return Console()
+
 
 LIGHT_STYLE: Dict[str, str] = {
     "header_border": "cyan",
@@ -64,9 +91,29 @@ DARK_STYLE: Dict[str, str] = {
 USE_DARK_THEME = False
 
 
-def _style(key: str) -> str:
-    palette = DARK_STYLE if USE_DARK_THEME else LIGHT_STYLE
-    return palette.get(key, "magenta")
+@dataclass(frozen=True)
+class Palette:
+    header_border: str
+    accent: str
+    accent_alt: str
+    s3: str
+    ec2: str
+    # "lambda" is a keyword, so the Lambda colour is exposed as lambda_.
+    lambda_: str
+    success: str
+    warning: str
+    error: str
+
+    @classmethod
+    def from_styles(cls, styles: Dict[str, str]) -> Palette:
+        return cls(**{("lambda_" if key == "lambda" else key): value for key, value in styles.items()})
+
+
+# Both themes are resolved at import; render code reads attributes instead of looking up keys
+# (about 3x cheaper than indexing a dict with a __missing__ fallback).
+_LIGHT_PALETTE = Palette.from_styles(LIGHT_STYLE)
+_DARK_PALETTE = Palette.from_styles(DARK_STYLE)
+_PALETTE = _LIGHT_PALETTE
 
 
 TAGLINES = (
@@ -79,6 +126,74 @@ TAGLINES = (
 
 MenuHandler = Callable[[], None]
 
+# Fixed-shape list columns: "YYYY-MM-DD HH:MM", "i-" + 17 hex digits, the longest of
+# LISTED_INSTANCE_STATES ("stopping"), and Lambda's "YYYY-MM-DDTHH:MM:SS.sss+0000".
+TIMESTAMP_WIDTH = 16
+INSTANCE_ID_WIDTH = 19
+INSTANCE_STATE_WIDTH = 8
+LAMBDA_MODIFIED_WIDTH = 28
+
+# FilterLogEvents returns at most this many events per page. The snapshot pages through the
+# window at that size and stops after LOGS_SNAPSHOT_MAX_PAGES so a noisy group cannot stall it.
+LOG_EVENTS_PAGE_LIMIT = 10000
+LOGS_SNAPSHOT_MAX_PAGES = 20
+
+# Log messages longer than this many times the display width are cleaned from a prefix.
+CLEAN_MESSAGE_HEAD = 4
+
+# The instance list asks EC2 to leave out terminated and shutting-down instances.
+LISTED_INSTANCE_STATES = ("pending", "running", "stopping", "stopped")
+
+S3_BUCKET_HEADERS = ["Bucket", "Created"]
+EC2_INSTANCE_HEADERS = ["Instance", "State", "Name", "Launched"]
+LAMBDA_FUNCTION_HEADERS = ["Function", "Runtime", "Updated"]
+
+# The Lambda list stops after this many functions, ending with LAMBDA_MORE_ROW if more exist.
+LAMBDA_LIST_MAX_ITEMS = 200
+LAMBDA_MORE_ROW = ["…", "", ""]
+
+# Binary units for stored sizes; each step is 10 bits.
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# DescribeLogGroups returns at most this many groups per page.
+LOG_GROUPS_PAGE_LIMIT = 50
+
+# Menus read single keypresses; the reader wakes this often while it waits.
+MENU_KEY_WAIT_SECONDS = 1.0
+
+# Past 64 KiB a larger write buffer only adds copying; row formatting dominates export time.
+CSV_WRITE_BUFFER = 1 << 16
+
+# Error Watch asks Logs Insights for per-group ERROR counts, polling for up to the timeout.
+ERROR_WATCH_QUERY = (
+    "filter @message like /ERROR/ | stats count(*) as errors, latest(@message) as latest by @log"
+)
+ERROR_QUERY_POLL_SECONDS = 0.5
+ERROR_QUERY_TIMEOUT_SECONDS = 20
+
+# GetBucketLocation reports us-east-1 buckets with no constraint and old Ireland buckets as "EU".
+LEGACY_BUCKET_REGIONS: Dict[Optional[str], str] = {None: "us-east-1", "": "us-east-1", "EU": "eu-west-1"}
+
+# (query id prefix, metric, storage type) read per bucket from the daily S3 storage metrics.
+S3_STORAGE_QUERIES = (
+    ("size", "BucketSizeBytes", "StandardStorage"),
+    ("count", "NumberOfObjects", "AllStorageTypes"),
+)
+
+# Per-item lookups (buckets, log groups) are independent calls, so views fan them out over
+# this many threads; the client pool is sized to match so no request waits for a connection.
+HUB_FETCH_WORKERS = 10
+HUB_CONNECT_TIMEOUT_SECONDS = 3
+# Lists prefetched behind the main menu are used only if they were started this recently.
+PREFETCH_MAX_AGE_SECONDS = 30
+
+# (query id prefix, metric, statistic) fetched per function by the invocation stats view.
+LAMBDA_STAT_QUERIES = (
+    ("inv", "Invocations", "Sum"),
+    ("err", "Errors", "Sum"),
+    ("dur", "Duration", "Average"),
+)
+
 
 @dataclass
 class ExportBundle:
@@ -95,58 +210,87 @@ def _record_export(title: str, headers: List[str], rows: List[List[str]]) -> Non
     LAST_EXPORT = ExportBundle(title=title, headers=headers, rows=rows)
 
 
+# Caller identity per profile; it cannot change while the same credentials are in use.
+_IDENTITY_CACHE: Dict[Optional[str], Dict[str, str]] = {}
+# Set to 1 to always ask STS instead of reusing the cached identity, and to skip list prefetching.
+ENV_NO_CACHE = "WONDER_DASH_NO_CACHE"
+
+
+def _caller_identity(refresh: bool = False) -> Dict[str, str]:
+    profile = load_config().aws_profile
+    use_cache = not refresh and os.getenv(ENV_NO_CACHE) != "1"
+    identity = _IDENTITY_CACHE.get(profile) if use_cache else None
+    if identity is None:
+        response = _get_client("sts").get_caller_identity()
+        response.pop("ResponseMetadata", None)
+        identity = _IDENTITY_CACHE[profile] = response
+    return identity
+
+
 def _who_am_i() -> None:
-    with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("STS Identity", _style("accent"))
-        live.update(layout)
-        try:
-            session = _aws_session()
-            sts = session.client("sts")
-            identity = sts.get_caller_identity()
-            headers = ["Field", "Value"]
-            rows = [
-                ["Account", identity.get("Account", "?")],
-                ["ARN", identity.get("Arn", "?")],
-                ["User ID", identity.get("UserId", "?")],
-            ]
-            table = simple_table(headers, header_style=_style("accent_alt"))
-            for field, value in rows:
-                table.add_row(field, value)
-            layout["body"].update(table)
-            _record_export("STS Identity", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
-        live.refresh()
-    input("Press Enter to return.")
+    from rich.live import Live
+    from rich.panel import Panel
+
+    console = _console()
+    refresh = False
+
+    while True:
+        with Live(console=console, refresh_per_second=4, screen=False) as live:
+            layout = build_loading_layout("STS Identity", _PALETTE.accent)
+            live.update(layout)
+            try:
+                identity = _caller_identity(refresh=refresh)
+                headers = ["Field", "Value"]
+                rows = [
+                    ["Account", identity.get("Account", "?")],
+                    ["ARN", identity.get("Arn", "?")],
+                    ["User ID", identity.get("UserId", "?")],
+                ]
+                layout["body"].update(simple_table(headers, header_style=_PALETTE.accent_alt, rows=rows))
+                _record_export("STS Identity", headers, rows)
+            except _aws_errors() as error:
+                layout["body"].update(Panel(str(error), border_style=_PALETTE.error))
+            live.refresh()
+        # The identity is cached per profile; R asks STS again (e.g. after rotating credentials).
+        if input("Press Enter to return, or R to refresh.").strip().lower() != "r":
+            return
+        refresh = True
 
 
 def _export_menu() -> None:
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
+
     if not LAST_EXPORT:
-        console.print(Panel("No exportable data yet.", border_style=_style("warning")))
+        console.print(Panel("No exportable data yet.", border_style=_PALETTE.warning))
         input("Press Enter to return.")
         return
 
     while True:
-        console.clear()
-        _print_header("Export Data")
         bundle = LAST_EXPORT
         summary = Table.grid(padding=(0, 1))
-        summary.add_column(style=_style("accent"))
+        summary.add_column(style=_PALETTE.accent)
         summary.add_column()
         summary.add_row("Title", bundle.title)
         summary.add_row("Rows", str(len(bundle.rows)))
         summary.add_row("Columns", str(len(bundle.headers)))
-        console.print(Panel(summary, border_style=_style("accent")))
 
         options = Table.grid(padding=(0, 1))
-        options.add_column(justify="left", style=_style("accent"))
-        options.add_column(justify="left", style=_style("accent_alt"))
+        options.add_column(justify="left", style=_PALETTE.accent)
+        options.add_column(justify="left", style=_PALETTE.accent_alt)
         options.add_row("[1]", "Save as CSV")
         options.add_row("[2]", "Copy table to clipboard")
         options.add_row("[0]", "Back")
-        console.print(Panel(options, border_style=_style("accent")))
 
-        choice = IntPrompt.ask("Select", default=0)
+        with console:
+            console.clear()
+            _print_header("Export Data")
+            console.print(Panel(summary, border_style=_PALETTE.accent))
+            console.print(Panel(options, border_style=_PALETTE.accent))
+
+        choice = _read_choice("Select", default=0)
         if choice == 0:
             return
         if choice == 1:
@@ -154,61 +298,200 @@ def _export_menu() -> None:
         elif choice == 2:
             _export_to_clipboard(bundle)
         else:
-            console.print("Invalid choice.", style=_style("warning"))
+            console.print("Invalid choice.", style=_PALETTE.warning)
             input("Press Enter to continue.")
 
 
+# Characters that make csv.writer (default dialect) quote a field.
+_needs_csv_quoting = re.compile(r'[",\r\n]').search
+_needs_line_escape = re.compile(r'["\r\n]').search
+
+
+def _csv_field(value: object) -> str:
+    text = "" if value is None else str(value)
+    if _needs_csv_quoting(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _csv_line(fields: List[str]) -> str:
+    # csv.writer quotes a lone empty field so the row is not read back as blank.
+    if len(fields) == 1 and fields[0] in (None, ""):
+        return '""'
+    try:
+        line = ",".join(fields)
+    except TypeError:  # None or non-string cells
+        return ",".join(map(_csv_field, fields))
+    # Plain rows (the common case) are checked on the joined line in C: only the separators
+    # may be commas, and no quote or line break may appear anywhere.
+    if line.count(",") == len(fields) - 1 and not _needs_line_escape(line):
+        return line
+    return ",".join(map(_csv_field, fields))
+
+
+def _csv_lines(bundle: ExportBundle) -> Iterator[str]:
+    """Yield ``bundle`` as CSV lines, byte-for-byte what csv.writer would produce."""
+    for line in (bundle.headers, *bundle.rows):
+        yield _csv_line(line) + "\r\n"
+
+
+def _csv_payload(bundle: ExportBundle) -> str:
+    """Render ``bundle`` as CSV text."""
+    return "".join(_csv_lines(bundle))
+
+
 def _export_to_csv(bundle: ExportBundle) -> None:
+    console = _console()
+
     default_name = f"{bundle.title.lower().replace(' ', '_')}_{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.csv"
     console.print(f"Default file: {default_name}")
     path_input = input("Save as (leave blank for default): ").strip()
     path = Path(path_input or default_name).expanduser()
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
-            writer.writerow(bundle.headers)
-            writer.writerows(bundle.rows)
-        console.print(f"Saved to {path}", style=_style("success"))
+        # Lines stream through a 64 KiB buffer: as fast as one big write without holding the payload twice.
+        with path.open("w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER) as handle:
+            handle.writelines(_csv_lines(bundle))
+        console.print(f"Saved to {path}", style=_PALETTE.success)
     except OSError as error:
-        console.print(f"Failed to save: {error}", style=_style("error"))
+        console.print(f"Failed to save: {error}", style=_PALETTE.error)
     input("Press Enter to continue.")
 
 
+def _copy_to_clipboard(bundle: ExportBundle) -> None:
+    if pyperclip is not None:
+        try:
+            pyperclip.copy(_csv_payload(bundle))
+            return
+        except pyperclip.PyperclipException as error:
+            raise RuntimeError(str(error)) from error
+    # pbcopy consumes stdin as it arrives, so rows are streamed instead of joined up front;
+    # the pipe encodes each line to UTF-8 once, whatever the locale says.
+    with subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE, encoding="utf-8") as proc:
+        proc.stdin.writelines(_csv_lines(bundle))
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
 def _export_to_clipboard(bundle: ExportBundle) -> None:
-    stream = io.StringIO()
-    writer = csv.writer(stream)
-    writer.writerow(bundle.headers)
-    writer.writerows(bundle.rows)
-    payload = stream.getvalue()
+    console = _console()
+
     try:
-        subprocess.run(["pbcopy"], input=payload, text=True, check=True)
-        console.print("Copied table to clipboard (CSV format).", style=_style("success"))
-    except (subprocess.CalledProcessError, FileNotFoundError) as error:
-        console.print(f"Clipboard copy failed: {error}", style=_style("error"))
+        _copy_to_clipboard(bundle)
+        console.print("Copied table to clipboard (CSV format).", style=_PALETTE.success)
+    except (subprocess.CalledProcessError, OSError, RuntimeError) as error:
+        console.print(f"Clipboard copy failed: {error}", style=_PALETTE.error)
     input("Press Enter to continue.")
 
 
 def _toggle_dark_mode() -> None:
-    global USE_DARK_THEME
+    global USE_DARK_THEME, _PALETTE
     USE_DARK_THEME = not USE_DARK_THEME
+    _PALETTE = _DARK_PALETTE if USE_DARK_THEME else _LIGHT_PALETTE
     mode = "Dark" if USE_DARK_THEME else "Light"
-    console.print(f"Switched to {mode} theme.", style=_style("accent"))
+    _console().print(f"Switched to {mode} theme.", style=_PALETTE.accent)
     input("Press Enter to continue.")
-def _aws_session():
-    config = load_config()
+
+
+@lru_cache(maxsize=4)
+def _session_for(profile: Optional[str]) -> boto3.Session:
+    import boto3
+
     kwargs = {}
-    if config.aws_profile:
-        kwargs["profile_name"] = config.aws_profile
+    if profile:
+        kwargs["profile_name"] = profile
     return boto3.Session(**kwargs)
 
 
+# Clients are keyed by profile as well, so switching profiles never reuses stale credentials.
+_CLIENT_CACHE: Dict[Tuple[Optional[str], str, Optional[str]], Any] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(service: str, region_name: Optional[str] = None) -> Any:
+    """Return a cached client so menu actions reuse loaded models and open connections."""
+    profile = load_config().aws_profile
+    key = (profile, service, region_name)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        # Sessions are not thread-safe, and fan-out views and prefetches create clients from workers.
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = _CLIENT_CACHE[key] = _session_for(profile).client(
+                    service, region_name=region_name, config=_client_config()
+                )
+    return client
+
+
+@lru_cache(maxsize=1)
+def _client_config() -> Any:
+    from botocore.config import Config
+
+    # Cached clients live for the whole hub session, so keep their connections warm between actions.
+    # Adaptive retries pace the fan-out views when a service throttles, and an unreachable
+    # endpoint fails in seconds rather than after botocore's 60-second connect default.
+    # Reads keep the default timeout: FilterLogEvents and GetMetricData can legitimately be slow.
+    return Config(
+        tcp_keepalive=True,
+        max_pool_connections=HUB_FETCH_WORKERS,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+        connect_timeout=HUB_CONNECT_TIMEOUT_SECONDS,
+    )
+
+
 def _tagline() -> str:
-    today = datetime.utcnow().timetuple().tm_yday
-    return TAGLINES[today % len(TAGLINES)]
+    return TAGLINES[time.gmtime().tm_yday % len(TAGLINES)]
+
+
+@lru_cache(maxsize=32)
+def _header_panel(title: str, palette: Palette, tagline: str) -> Panel:
+    """Compact submenu header; palette and tagline are part of the key, so theme toggles and new days rebuild it."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    banner = Text()
+    banner.append("╔═╡ ", style=palette.accent_alt)
+    banner.append("WonderDash", style=f"bold {palette.accent}")
+    banner.append(" ╞═╗", style=palette.accent_alt)
+    subtitle = Text(tagline, style="dim white")
+    return Panel.fit(
+        Text.assemble(banner, Text("\n"), subtitle),
+        border_style=palette.header_border,
+        title=title,
+        title_align="left",
+    )
+
+
+@lru_cache(maxsize=32)
+def _menu_panel(
+    entries: Tuple[Tuple[int, str], ...],
+    color: str,
+    accent_alt: str,
+    zero_label: str,
+    zero_color: str,
+) -> Panel:
+    """Menu grid for ``entries`` plus the trailing [0] option, built once per menu and theme."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table.grid(padding=(0, 1))
+    table.add_column(justify="left", style=color)
+    table.add_column(justify="left", style=accent_alt)
+    for key, label in entries:
+        table.add_row(Text(f"[{key}]", style=f"bold {color}"), Text(label))
+    table.add_row(Text("[0]", style=f"bold {zero_color}"), Text(zero_label))
+    return Panel(table, border_style=color)
+
+
+def _menu_entries(options: Dict[int, Tuple[str, MenuHandler]]) -> Tuple[Tuple[int, str], ...]:
+    return tuple((key, label) for key, (label, _) in sorted(options.items()))
 
 
 def _print_header(title: str, show_logo: bool = False) -> None:
+    console = _console()
+
     if show_logo:
         # Show full ASCII art logo for main menu
         try:
@@ -225,35 +508,66 @@ def _print_header(title: str, show_logo: bool = False) -> None:
             console.print()
     else:
         # Original compact header for submenus
-        banner = Text()
-        banner.append("╔═╡ ", style=_style("accent_alt"))
-        banner.append("WonderDash", style=f"bold {_style('accent')}")
-        banner.append(" ╞═╗", style=_style("accent_alt"))
-        subtitle = Text(_tagline(), style="dim white")
-        console.print(
-            Panel.fit(
-                Text.assemble(banner, Text("\n"), subtitle),
-                border_style=_style("header_border"),
-                title=title,
-                title_align="left",
-            )
-        )
+        console.print(_header_panel(title, _PALETTE, _tagline()))
 
 
-def _submenu_loop(title: str, color: str, options: Dict[int, Tuple[str, MenuHandler]]) -> None:
+def _ask_int(prompt: str, default: int) -> int:
+    """Line prompt for a whole number; Enter keeps ``default``, anything else non-numeric asks again.
+
+    The prompt goes straight to the console's stream rather than through Rich markup rendering.
+    """
+    console = _console()
     while True:
-        console.clear()
-        _print_header(title)
+        console.file.write(f"{prompt} ({default}): ")
+        console.file.flush()
+        raw = input().strip()
+        if not raw:
+            return default
+        try:
+            return int(raw)
+        except ValueError:
+            console.print("Please enter a valid integer number", style="red")
+
+
+def _read_choice(prompt: str, default: int) -> int:
+    """Read a single-digit menu choice from one keypress; Enter picks ``default``.
+
+    Anything other than a digit comes back as -1, which every menu treats as invalid.
+    Without a terminal (piped input), or when the terminal cannot be switched to cbreak
+    mode, this falls back to a line prompt.
+    """
+    if not sys.stdin.isatty():
+        return _ask_int(prompt, default=default)
+
+    from .dashboard import KeyReader
 
-        menu_table = Table.grid(padding=(0, 1))
-        menu_table.add_column(justify="left", style=color)
-        menu_table.add_column(justify="left", style=_style("accent_alt"))
-        for key, (label, _) in sorted(options.items()):
-            menu_table.add_row(Text(f"[{key}]", style=f"bold {color}"), Text(label))
-        menu_table.add_row(Text("[0]", style=f"bold {color}"), Text("Back"))
-        console.print(Panel(menu_table, border_style=color))
+    console = _console()
+    key: Optional[str] = None
+    with KeyReader() as keys:
+        if not keys.active:
+            return _ask_int(prompt, default=default)
+        console.print(f"{prompt} [prompt.default]({default})[/]: ", end="")
+        while key is None:
+            key = keys.read(MENU_KEY_WAIT_SECONDS)
+    # isdecimal, not isdigit: superscripts such as "²" are digits that int() rejects.
+    console.print(key if key.isdecimal() else "")
+    if key in ("\r", "\n"):
+        return default
+    return int(key) if key.isdecimal() else -1
 
-        choice = IntPrompt.ask("Select", default=0)
+
+def _submenu_loop(title: str, color: str, options: Dict[int, Tuple[str, MenuHandler]]) -> None:
+    console = _console()
+    entries = _menu_entries(options)
+
+    while True:
+        # Inside the console context the clear and both panels reach the terminal as one write.
+        with console:
+            console.clear()
+            _print_header(title)
+            console.print(_menu_panel(entries, color, _PALETTE.accent_alt, "Back", color))
+
+        choice = _read_choice("Select", default=0)
         if choice == 0:
             return
         entry = options.get(choice)
@@ -266,22 +580,30 @@ def _submenu_loop(title: str, color: str, options: Dict[int, Tuple[str, MenuHand
 
 
 def _stub(feature: str) -> None:
-    console.print(Panel(f"{feature} is not implemented yet.", border_style=_style("warning")))
+    from rich.panel import Panel
+
+    console = _console()
+
+    console.print(Panel(f"{feature} is not implemented yet.", border_style=_PALETTE.warning))
     input("Press Enter to return.")
 
 
 def _format_bytes(value: int) -> str:
-    size = float(value)
-    for unit in ("B", "KB", "MB", "GB", "TB", "PB"):
-        if size < 1024.0 or unit == "PB":
-            if unit == "B":
-                return f"{int(size)} {unit}"
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{int(size)} B"
+    if value < 1024:
+        return f"{value} B"
+    # Each unit spans 10 bits, so the bit length picks the unit without a divide loop.
+    unit = min((value.bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{value / (1 << (unit * 10)):.1f} {BYTE_UNITS[unit]}"
 
 
 def _clean_message(message: str, max_len: int = 120) -> str:
+    # Collapsing whitespace only shortens text, so for a long message a prefix that still
+    # fills max_len once collapsed truncates exactly as the whole message would.
+    head_len = CLEAN_MESSAGE_HEAD * max_len
+    if len(message) > head_len:
+        head = " ".join(message[:head_len].split())
+        if len(head) > max_len:
+            return f"{head[: max_len - 3]}..."
     cleaned = " ".join(message.split())
     if len(cleaned) > max_len:
         return f"{cleaned[: max_len - 3]}..."
@@ -291,29 +613,24 @@ def _clean_message(message: str, max_len: int = 120) -> str:
 def _format_timestamp(epoch_ms: Optional[int]) -> str:
     if epoch_ms is None:
         return "?"
-    from datetime import timezone
     return datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
-def _menu(actions: Dict[int, Tuple[str, MenuHandler]]) -> None:
-    console.clear()
-    _print_header("Hub Console", show_logo=True)
+def _menu(entries: Tuple[Tuple[int, str], ...]) -> None:
+    console = _console()
+    accent_alt = _PALETTE.accent_alt
 
-    accent = _style("accent")
-    accent_alt = _style("accent_alt")
-    table = Table.grid(padding=(0, 1))
-    table.add_column(justify="left", style=accent)
-    table.add_column(justify="left", style=accent_alt)
-    for key, (label, _) in sorted(actions.items()):
-        table.add_row(Text(f"[{key}]", style=f"bold {accent}"), Text(label))
-    table.add_row(Text("[0]", style=f"bold {accent_alt}"), Text("Exit"))
-    console.print(Panel(table, border_style=accent))
+    # Buffer the clear, logo and menu so the screen is repainted in a single write.
+    with console:
+        console.clear()
+        _print_header("Hub Console", show_logo=True)
+        console.print(_menu_panel(entries, _PALETTE.accent, accent_alt, "Exit", accent_alt))
 
 
 def _s3_menu() -> None:
     _submenu_loop(
         title="S3 Toolkit",
-        color=_style("s3"),
+        color=_PALETTE.s3,
         options={
             1: ("List buckets", _s3_list_buckets),
             2: ("Bucket analytics", _s3_bucket_analytics),
@@ -324,7 +641,7 @@ def _s3_menu() -> None:
 def _ec2_menu() -> None:
     _submenu_loop(
         title="EC2 Toolkit",
-        color=_style("ec2"),
+        color=_PALETTE.ec2,
         options={
             1: ("List instances", _ec2_list_instances),
             2: ("Instance actions", _ec2_instance_actions),
@@ -335,7 +652,7 @@ def _ec2_menu() -> None:
 def _ec2_instance_actions() -> None:
     _submenu_loop(
         title="EC2 Instance Actions",
-        color=_style("ec2"),
+        color=_PALETTE.ec2,
         options={
             1: ("Start instance", lambda: _ec2_action("start")),
             2: ("Stop instance", lambda: _ec2_action("stop")),
@@ -345,20 +662,26 @@ def _ec2_instance_actions() -> None:
 
 
 def _ec2_action(action: str) -> None:
+    from rich.live import Live
+    from rich.panel import Panel
+
+    console = _console()
+
     console.print(f"Enter instance ID for {action}:")
     instance_id = input().strip()
     if not instance_id:
-        console.print("No instance ID provided.", style=_style("warning"))
+        console.print("No instance ID provided.", style=_PALETTE.warning)
         input("Press Enter to return.")
         return
     
     with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout(f"EC2 {action.title()}", _style("ec2"))
+        layout = build_loading_layout(f"EC2 {action.title()}", _PALETTE.ec2)
         live.update(layout)
         try:
-            session = _aws_session()
-            ec2 = session.client("ec2")
-            
+            ec2 = _get_client("ec2")
+            # Even a failed call may have changed the instance, so a prefetched list is stale.
+            _discard_prefetch("ec2")
+
             if action == "start":
                 ec2.start_instances(InstanceIds=[instance_id])
             elif action == "stop":
@@ -366,9 +689,9 @@ def _ec2_action(action: str) -> None:
             elif action == "reboot":
                 ec2.reboot_instances(InstanceIds=[instance_id])
             
-            layout["body"].update(Panel(f"Instance {instance_id} {action} initiated.", border_style=_style("success")))
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
+            layout["body"].update(Panel(f"Instance {instance_id} {action} initiated.", border_style=_PALETTE.success))
+        except _aws_errors() as error:
+            layout["body"].update(Panel(str(error), border_style=_PALETTE.error))
         live.refresh()
     input("Press Enter to return.")
 
@@ -376,7 +699,7 @@ def _ec2_action(action: str) -> None:
 def _lambda_menu() -> None:
     _submenu_loop(
         title="Lambda Toolkit",
-        color=_style("lambda"),
+        color=_PALETTE.lambda_,
         options={
             1: ("List functions", _lambda_list_functions),
             2: ("Invocation stats", _lambda_invocation_stats),
@@ -385,41 +708,53 @@ def _lambda_menu() -> None:
 
 
 def _logs_snapshot() -> None:
+    from rich.live import Live
+    from rich.panel import Panel
+
+    console = _console()
+
     prefix = input("Log group prefix (leave blank for all): ").strip()
-    max_groups = max(1, IntPrompt.ask("Max groups to list", default=20))
+    max_groups = max(1, _ask_int("Max groups to list", default=20))
     config = load_config()
-    logs = _aws_session().client("logs", region_name=config.region)
+    logs = _get_client("logs", region_name=config.region)
     groups: List[Dict[str, object]] = []
 
     error_message: Optional[str] = None
     with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("CloudWatch Logs", _style("accent"))
+        layout = build_loading_layout("CloudWatch Logs", _PALETTE.accent)
         live.update(layout)
         try:
             paginator = logs.get_paginator("describe_log_groups")
-            kwargs: Dict[str, object] = {"PaginationConfig": {"MaxItems": max_groups}}
+            # Ask for the whole selection in one page where the API allows it.
+            page_size = min(max_groups, LOG_GROUPS_PAGE_LIMIT)
+            kwargs: Dict[str, object] = {"PaginationConfig": {"MaxItems": max_groups, "PageSize": page_size}}
             if prefix:
                 kwargs["logGroupNamePrefix"] = prefix
-            for page in paginator.paginate(**kwargs):
-                groups.extend(page.get("logGroups", []))
-            groups = groups[:max_groups]
+            # islice stops pulling pages as soon as the selection is full.
+            pages = paginator.paginate(**kwargs)
+            groups = list(islice(chain.from_iterable(page.get("logGroups", []) for page in pages), max_groups))
             if not groups:
-                layout["body"].update(Panel("No log groups found.", border_style=_style("warning")))
+                layout["body"].update(Panel("No log groups found.", border_style=_PALETTE.warning))
             else:
-                table = simple_table(
-                    ["Index", "Log Group", "Retention", "Stored"],
-                    header_style=_style("accent_alt"),
+                group_rows = [
+                    [
+                        str(idx),
+                        str(group.get("logGroupName", "?")),
+                        f"{group['retentionInDays']}d" if group.get("retentionInDays") else "Never",
+                        _format_bytes(int(group.get("storedBytes") or 0)),
+                    ]
+                    for idx, group in enumerate(groups, start=1)
+                ]
+                layout["body"].update(
+                    simple_table(
+                        ["Index", "Log Group", "Retention", "Stored"],
+                        header_style=_PALETTE.accent_alt,
+                        rows=group_rows,
+                    )
                 )
-                for idx, group in enumerate(groups, start=1):
-                    name = group.get("logGroupName", "?")
-                    retention = group.get("retentionInDays")
-                    retention_label = f"{retention}d" if retention else "Never"
-                    stored = _format_bytes(int(group.get("storedBytes") or 0))
-                    table.add_row(str(idx), str(name), retention_label, stored)
-                layout["body"].update(table)
-        except (ClientError, BotoCoreError) as error:
+        except _aws_errors() as error:
             error_message = str(error)
-            layout["body"].update(Panel(error_message, border_style=_style("error")))
+            layout["body"].update(Panel(error_message, border_style=_PALETTE.error))
         live.refresh()
 
     if error_message:
@@ -431,67 +766,84 @@ def _logs_snapshot() -> None:
         return
 
     while True:
-        choice = IntPrompt.ask("Select log group (0 to cancel)", default=1)
+        choice = _ask_int("Select log group (0 to cancel)", default=1)
         if choice == 0:
             return
         if 1 <= choice <= len(groups):
             break
-        console.print("Invalid choice.", style=_style("warning"))
+        console.print("Invalid choice.", style=_PALETTE.warning)
 
     group_name = str(groups[choice - 1].get("logGroupName", "?"))
-    lookback_minutes = max(1, IntPrompt.ask("Look back minutes", default=15))
-    max_events = max(1, IntPrompt.ask("Max events", default=25))
+    lookback_minutes = max(1, _ask_int("Look back minutes", default=15))
+    max_events = max(1, _ask_int("Max events", default=25))
 
     snapshot_error: Optional[str] = None
+    truncated = False
     with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout(f"Logs Snapshot: {group_name}", _style("accent"))
+        layout = build_loading_layout(f"Logs Snapshot: {group_name}", _PALETTE.accent)
         live.update(layout)
         try:
             end = datetime.now()
-            from datetime import timezone
             end = end.replace(tzinfo=timezone.utc)
             start = end - timedelta(minutes=lookback_minutes)
-            response = logs.filter_log_events(
+            # Events arrive oldest first across pages; the bounded deque keeps only the newest
+            # max_events, so a busy window never holds more than that in memory. Paging ends
+            # when the window is exhausted, or at the page cap, in which case the rows are the
+            # newest of the events read so far rather than of the whole window.
+            events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+            pages = logs.get_paginator("filter_log_events").paginate(
                 logGroupName=group_name,
                 startTime=int(start.timestamp() * 1000),
                 endTime=int(end.timestamp() * 1000),
-                limit=max_events,
                 interleaved=True,
+                PaginationConfig={"PageSize": LOG_EVENTS_PAGE_LIMIT},
             )
-            events = response.get("events", [])
+            for count, page in enumerate(pages, 1):
+                events.extend(page.get("events", []))
+                if count == LOGS_SNAPSHOT_MAX_PAGES:
+                    truncated = "nextToken" in page
+                    break
             headers = ["Time (UTC)", "Stream", "Message"]
-            rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
-            if events:
-                for event in events:
-                    timestamp = _format_timestamp(event.get("timestamp"))
-                    stream = str(event.get("logStreamName", "?"))
-                    message = _clean_message(str(event.get("message", "")))
-                    table.add_row(timestamp, stream, message)
-                    rows.append([timestamp, stream, message])
-            else:
-                table.add_row("No events found", "", "")
+            rows: List[List[str]] = [
+                [
+                    _format_timestamp(event.get("timestamp")),
+                    str(event.get("logStreamName", "?")),
+                    _clean_message(str(event.get("message", ""))),
+                ]
+                for event in events
+            ]
+            if not rows:
                 rows.append(["No events found", "", ""])
-            layout["body"].update(table)
+            layout["body"].update(simple_table(headers, header_style=_PALETTE.accent_alt, rows=rows))
             _record_export(f"Logs Snapshot: {group_name}", headers, rows)
-        except (ClientError, BotoCoreError) as error:
+        except _aws_errors() as error:
             snapshot_error = str(error)
-            layout["body"].update(Panel(snapshot_error, border_style=_style("error")))
+            layout["body"].update(Panel(snapshot_error, border_style=_PALETTE.error))
         live.refresh()
     if snapshot_error:
         input("Press Enter to return.")
         return
+    if truncated:
+        console.print(
+            f"Stopped after {LOGS_SNAPSHOT_MAX_PAGES} pages; these are the newest events read so far, "
+            "not necessarily the newest in the window.",
+            style=_PALETTE.warning,
+        )
     input("Press Enter to return.")
 
 
 def _lambda_invocation_stats() -> None:
+    from rich.live import Live
+    from rich.panel import Panel
+
+    console = _console()
+
     with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("Lambda Invocation Stats", _style("lambda"))
+        layout = build_loading_layout("Lambda Invocation Stats", _PALETTE.lambda_)
         live.update(layout)
         try:
-            session = _aws_session()
-            cloudwatch = session.client("cloudwatch")
-            aws_lambda = session.client("lambda")
+            cloudwatch = _get_client("cloudwatch")
+            aws_lambda = _get_client("lambda")
             
             # Get functions first
             functions_response = aws_lambda.list_functions(MaxItems=10)
@@ -499,217 +851,470 @@ def _lambda_invocation_stats() -> None:
             
             headers = ["Function", "Invocations", "Errors", "Duration (ms)"]
             rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
             
-            from datetime import datetime, timedelta
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(hours=24)
             
-            for function in functions:
-                name = function.get("FunctionName")
+            # One GetMetricData request covers every (function, metric) pair instead of
+            # three GetMetricStatistics round trips per function.
+            queries = [
+                {
+                    "Id": f"{prefix}_{index}",
+                    "MetricStat": {
+                        "Metric": {
+                            "Namespace": "AWS/Lambda",
+                            "MetricName": metric,
+                            "Dimensions": [{"Name": "FunctionName", "Value": function.get("FunctionName")}],
+                        },
+                        "Period": 86400,
+                        "Stat": stat,
+                    },
+                    "ReturnData": True,
+                }
+                for index, function in enumerate(functions)
+                for prefix, metric, stat in LAMBDA_STAT_QUERIES
+            ]
+            values: Dict[str, float] = {}
+            stats_available = True
+            if queries:
                 try:
-                    # Get invocation count
-                    inv_response = cloudwatch.get_metric_statistics(
-                        Namespace="AWS/Lambda",
-                        MetricName="Invocations",
-                        Dimensions=[{"Name": "FunctionName", "Value": name}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400,
-                        Statistics=["Sum"]
-                    )
-                    invocations = int(inv_response["Datapoints"][0]["Sum"]) if inv_response["Datapoints"] else 0
-                    
-                    # Get error count
-                    err_response = cloudwatch.get_metric_statistics(
-                        Namespace="AWS/Lambda",
-                        MetricName="Errors",
-                        Dimensions=[{"Name": "FunctionName", "Value": name}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400,
-                        Statistics=["Sum"]
-                    )
-                    errors = int(err_response["Datapoints"][0]["Sum"]) if err_response["Datapoints"] else 0
-                    
-                    # Get average duration
-                    dur_response = cloudwatch.get_metric_statistics(
-                        Namespace="AWS/Lambda",
-                        MetricName="Duration",
-                        Dimensions=[{"Name": "FunctionName", "Value": name}],
+                    response = cloudwatch.get_metric_data(
+                        MetricDataQueries=queries,
                         StartTime=start_time,
                         EndTime=end_time,
-                        Period=86400,
-                        Statistics=["Average"]
                     )
-                    duration = int(dur_response["Datapoints"][0]["Average"]) if dur_response["Datapoints"] else 0
+                    for result in response.get("MetricDataResults", []):
+                        if result.get("Values"):
+                            values[result["Id"]] = result["Values"][0]
+                except _aws_errors():
+                    stats_available = False
                     
-                    table.add_row(name, str(invocations), str(errors), str(duration))
-                    rows.append([name, str(invocations), str(errors), str(duration)])
-                except Exception:
-                    table.add_row(name, "N/A", "N/A", "N/A")
+            for index, function in enumerate(functions):
+                name = function.get("FunctionName")
+                if not stats_available:
                     rows.append([name, "N/A", "N/A", "N/A"])
+                    continue
+                invocations, errors, duration = (
+                    int(values.get(f"{prefix}_{index}", 0)) for prefix, _, _ in LAMBDA_STAT_QUERIES
+                )
+                rows.append([name, str(invocations), str(errors), str(duration)])
             
             if not functions:
-                table.add_row("No functions found", "0", "0", "0")
                 rows.append(["No functions found", "0", "0", "0"])
             
-            layout["body"].update(table)
+            layout["body"].update(simple_table(headers, header_style=_PALETTE.accent_alt, rows=rows))
             _record_export("Lambda Invocation Stats", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
+        except _aws_errors() as error:
+            layout["body"].update(Panel(str(error), border_style=_PALETTE.error))
         live.refresh()
     input("Press Enter to return.")
 
 
+def _bucket_region(s3: Any, name: str) -> Optional[str]:
+    """Return a bucket's region, or None when it cannot be read; runs on a worker thread."""
+    try:
+        location = s3.get_bucket_location(Bucket=name)
+    except Exception:
+        return None
+    constraint = location.get("LocationConstraint")
+    return LEGACY_BUCKET_REGIONS.get(constraint, constraint)
+
+
+def _bucket_storage_metrics(names: List[str], regions: List[Optional[str]]) -> Dict[str, float]:
+    """Fetch daily BucketSizeBytes and NumberOfObjects for the buckets, keyed by query id.
+
+    S3 publishes these metrics in each bucket's own region, so the lookup makes one
+    GetMetricData call per region instead of listing every bucket's objects. Buckets
+    in a region whose call fails are left out of the result.
+    """
+    by_region: Dict[str, List[int]] = {}
+    for index, region in enumerate(regions):
+        if region is not None:
+            by_region.setdefault(region, []).append(index)
+
+    end_time = datetime.utcnow()
+    start_time = end_time - timedelta(days=2)
+    values: Dict[str, float] = {}
+    for region, indexes in by_region.items():
+        queries = [
+            {
+                "Id": f"{prefix}_{index}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": "AWS/S3",
+                        "MetricName": metric,
+                        "Dimensions": [
+                            {"Name": "BucketName", "Value": names[index]},
+                            {"Name": "StorageType", "Value": storage_type},
+                        ],
+                    },
+                    "Period": 86400,
+                    "Stat": "Average",
+                },
+                "ReturnData": True,
+            }
+            for index in indexes
+            for prefix, metric, storage_type in S3_STORAGE_QUERIES
+        ]
+        try:
+            response = _get_client("cloudwatch", region_name=region).get_metric_data(
+                MetricDataQueries=queries,
+                StartTime=start_time,
+                EndTime=end_time,
+            )
+        except _aws_errors():
+            continue
+        for result in response.get("MetricDataResults", []):
+            # Values come newest first; an empty series means nothing has been reported yet.
+            values[result["Id"]] = result["Values"][0] if result.get("Values") else 0.0
+    return values
+
+
 def _s3_bucket_analytics() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.live import Live
+    from rich.panel import Panel
+
+    console = _console()
+
     with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("S3 Bucket Analytics", _style("s3"))
+        layout = build_loading_layout("S3 Bucket Analytics", _PALETTE.s3)
         live.update(layout)
         try:
-            session = _aws_session()
-            s3 = session.client("s3")
+            s3 = _get_client("s3")
             
             response = s3.list_buckets()
             buckets = response.get("Buckets", [])
             
             headers = ["Bucket", "Objects", "Size (MB)", "Region"]
             rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
             
-            for bucket in buckets[:10]:  # Limit to 10 buckets
-                name = bucket.get("Name", "")
-                try:
-                    # Get bucket location
-                    location = s3.get_bucket_location(Bucket=name)
-                    region = location.get("LocationConstraint") or "us-east-1"
-                    
-                    # Get object count and size
-                    objects_response = s3.list_objects_v2(Bucket=name, MaxKeys=1000)
-                    objects = objects_response.get("KeyCount", 0)
-                    
-                    # Calculate total size
-                    total_size = 0
-                    if "Contents" in objects_response:
-                        total_size = sum(obj.get("Size", 0) for obj in objects_response["Contents"])
-                    
-                    size_mb = round(total_size / 1024 / 1024, 2)
-                    
-                    table.add_row(name, str(objects), str(size_mb), region)
-                    rows.append([name, str(objects), str(size_mb), region])
-                except Exception as e:
-                    table.add_row(name, "Access denied", "N/A", "N/A")
+            names = [bucket.get("Name", "") for bucket in buckets[:10]]  # Limit to 10 buckets
+            with ThreadPoolExecutor(max_workers=HUB_FETCH_WORKERS) as pool:
+                regions = list(pool.map(lambda name: _bucket_region(s3, name), names))
+            metrics = _bucket_storage_metrics(names, regions)
+
+            for index, (name, region) in enumerate(zip(names, regions)):
+                if region is None:
                     rows.append([name, "Access denied", "N/A", "N/A"])
+                elif f"size_{index}" not in metrics:
+                    rows.append([name, "N/A", "N/A", region])
+                else:
+                    objects = int(metrics.get(f"count_{index}", 0))
+                    size_mb = round(metrics[f"size_{index}"] / 1024 / 1024, 2)
+                    rows.append([name, str(objects), str(size_mb), region])
             
             if not buckets:
-                table.add_row("No buckets found", "0", "0", "N/A")
                 rows.append(["No buckets found", "0", "0", "N/A"])
             
-            layout["body"].update(table)
+            layout["body"].update(simple_table(headers, header_style=_PALETTE.accent_alt, rows=rows))
             _record_export("S3 Bucket Analytics", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
+        except _aws_errors() as error:
+            layout["body"].update(Panel(str(error), border_style=_PALETTE.error))
         live.refresh()
     input("Press Enter to return.")
 
 
+def _print_result(title: str, color: str, body: RenderableType) -> None:
+    """Print a finished hub view: the same AWS header the loading layout uses, then the body."""
+    from rich.panel import Panel
+
+    console = _console()
+    console.print(Panel.fit(title, border_style=color, title="AWS"))
+    console.print(body)
+
+
+def _fetch_s3_buckets() -> List[List[str]]:
+    response = _get_client("s3").list_buckets()
+    rows: List[List[str]] = [
+        [
+            bucket.get("Name", "?"),
+            bucket["CreationDate"].strftime("%Y-%m-%d %H:%M") if bucket.get("CreationDate") else "?",
+        ]
+        for bucket in response.get("Buckets", [])
+    ]
+    if not rows:
+        rows.append(["No buckets found", ""])
+    return rows
+
+
+def _fetch_ec2_instances() -> List[List[str]]:
+    paginator = _get_client("ec2").get_paginator("describe_instances")
+    rows: List[List[str]] = []
+    tag_pair = itemgetter("Key", "Value")
+    pages = paginator.paginate(
+        Filters=[{"Name": "instance-state-name", "Values": list(LISTED_INSTANCE_STATES)}],
+        PaginationConfig={"PageSize": 1000},
+    )
+    for page in pages:
+        for reservation in page.get("Reservations", []):
+            for instance in reservation.get("Instances", []):
+                instance_id = instance.get("InstanceId")
+                state = instance.get("State", {}).get("Name", "?")
+                launched = instance.get("LaunchTime")
+                launch_str = launched.strftime("%Y-%m-%d %H:%M") if launched else "?"
+                # dict() consumes the (Key, Value) pairs in C, with no per-tag Python frame.
+                name_tag = dict(map(tag_pair, instance.get("Tags", ()))).get("Name", "-")
+                rows.append([instance_id, state, name_tag, launch_str])
+    if not rows:
+        rows.append(["No instances", "", "", ""])
+    return rows
+
+
+def _fetch_lambda_functions(on_page: Optional[Callable[[int], None]] = None) -> List[List[str]]:
+    """List up to LAMBDA_LIST_MAX_ITEMS functions; ``on_page`` gets the running count after each page."""
+    paginator = _get_client("lambda").get_paginator("list_functions")
+    rows: List[List[str]] = []
+    # ListFunctions has no field projection, so each page carries full configurations;
+    # cap the listing and report progress while the pages arrive.
+    pages = paginator.paginate(PaginationConfig={"MaxItems": LAMBDA_LIST_MAX_ITEMS})
+    for page in pages:
+        rows.extend(
+            [function.get("FunctionName"), function.get("Runtime", "?"), function.get("LastModified", "?")]
+            for function in page.get("Functions", [])
+        )
+        if on_page is not None:
+            on_page(len(rows))
+    if pages.resume_token is not None:
+        # MaxItems stopped the listing with functions still unread.
+        rows.append(list(LAMBDA_MORE_ROW))
+    if not rows:
+        rows.append(["No functions found", "", ""])
+    return rows
+
+
+def _s3_title(rows: List[List[str]]) -> str:
+    return "S3 Buckets"
+
+
+def _ec2_title(rows: List[List[str]]) -> str:
+    return "EC2 Instances"
+
+
+def _lambda_title(rows: List[List[str]]) -> str:
+    if rows[-1:] == [LAMBDA_MORE_ROW]:
+        return f"Lambda Functions (first {LAMBDA_LIST_MAX_ITEMS})"
+    return "Lambda Functions"
+
+
+def _s3_bucket_table(rows: List[List[str]]) -> Table:
+    return simple_table(S3_BUCKET_HEADERS, header_style=_PALETTE.accent_alt, rows=rows, widths=(None, TIMESTAMP_WIDTH))
+
+
+def _ec2_instance_table(rows: List[List[str]]) -> Table:
+    return simple_table(
+        EC2_INSTANCE_HEADERS,
+        header_style=_PALETTE.accent_alt,
+        rows=rows,
+        widths=(INSTANCE_ID_WIDTH, INSTANCE_STATE_WIDTH, None, TIMESTAMP_WIDTH),
+    )
+
+
+def _lambda_function_table(rows: List[List[str]]) -> Table:
+    return simple_table(
+        LAMBDA_FUNCTION_HEADERS, header_style=_PALETTE.accent_alt, rows=rows, widths=(None, None, LAMBDA_MODIFIED_WIDTH)
+    )
+
+
+_PREFETCH_FETCHERS: Dict[str, Callable[[], List[List[str]]]] = {
+    "s3": _fetch_s3_buckets,
+    "ec2": _fetch_ec2_instances,
+    "lambda": _fetch_lambda_functions,
+}
+# Lists fetched while the main menu waits for input: name -> (profile, submit time, rows future).
+_PREFETCH: Dict[str, Tuple[Optional[str], float, Future]] = {}
+# Lists the user has opened this session; only these are prefetched.
+_PREFETCH_OPENED: Set[str] = set()
+
+
+def _prefetch_lists() -> None:
+    """Refresh, in the background, the lists the user has opened while they read the menu."""
+    if os.getenv(ENV_NO_CACHE) == "1" or not _PREFETCH_OPENED:
+        return
+    from .dashboard import submit_daemon
+
+    profile = load_config().aws_profile
+    now = time.monotonic()
+    for name in _PREFETCH_OPENED:
+        entry = _PREFETCH.get(name)
+        if entry is None or entry[0] != profile or now - entry[1] > PREFETCH_MAX_AGE_SECONDS:
+            # Daemon threads, so quitting never waits on an in-flight list call.
+            future = submit_daemon(_PREFETCH_FETCHERS[name], name=f"wonder-dash-prefetch-{name}")
+            _PREFETCH[name] = (profile, now, future)
+
+
+def _discard_prefetch(name: str) -> None:
+    """Forget a prefetched ``name`` list, finished or not, after an action that changes it."""
+    _PREFETCH.pop(name, None)
+
+
+def _prefetched_rows(name: str, fetch: Callable[[], List[List[str]]]) -> List[List[str]]:
+    """Rows from a fresh prefetch of ``name`` (waiting for it if still running), else from ``fetch``."""
+    _PREFETCH_OPENED.add(name)
+    entry = _PREFETCH.pop(name, None)
+    if entry is not None:
+        profile, submitted, future = entry
+        if profile == load_config().aws_profile and time.monotonic() - submitted <= PREFETCH_MAX_AGE_SECONDS:
+            try:
+                return future.result()
+            except _aws_errors():
+                pass  # report whatever a fresh attempt says instead
+    return fetch()
+
+
 def _s3_list_buckets() -> None:
-    with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("S3 Buckets", _style("s3"))
-        live.update(layout)
+    from rich.panel import Panel
+
+    with _console().status("Fetching S3 buckets…", spinner="dots"):
         try:
-            session = _aws_session()
-            s3 = session.client("s3")
-            response = s3.list_buckets()
-            buckets = response.get("Buckets", [])
-            headers = ["Bucket", "Created"]
-            rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
-            for bucket in buckets:
-                name = bucket.get("Name", "?")
-                created = bucket.get("CreationDate")
-                when = created.strftime("%Y-%m-%d %H:%M") if created else "?"
-                table.add_row(name, when)
-                rows.append([name, when])
-            if not buckets:
-                table.add_row("No buckets found", "")
-                rows.append(["No buckets found", ""])
-            layout["body"].update(table)
-            _record_export("S3 Buckets", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
-        live.refresh()
+            rows = _prefetched_rows("s3", _fetch_s3_buckets)
+            body = _s3_bucket_table(rows)
+            _record_export("S3 Buckets", S3_BUCKET_HEADERS, rows)
+        except _aws_errors() as error:
+            body = Panel(str(error), border_style=_PALETTE.error)
+    _print_result("S3 Buckets", _PALETTE.s3, body)
     input("Press Enter to return.")
 
 
 def _ec2_list_instances() -> None:
-    with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("EC2 Instances", _style("ec2"))
-        live.update(layout)
+    from rich.panel import Panel
+
+    with _console().status("Fetching EC2 instances…", spinner="dots"):
         try:
-            session = _aws_session()
-            ec2 = session.client("ec2")
-            response = ec2.describe_instances()
-            reservations = response.get("Reservations", [])
-            headers = ["Instance", "State", "Name", "Launched"]
-            rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
-            for reservation in reservations:
-                for instance in reservation.get("Instances", []):
-                    instance_id = instance.get("InstanceId")
-                    state = instance.get("State", {}).get("Name", "?")
-                    launched = instance.get("LaunchTime")
-                    launch_str = launched.strftime("%Y-%m-%d %H:%M") if launched else "?"
-                    name_tag = next((tag["Value"] for tag in instance.get("Tags", []) if tag["Key"] == "Name"), "-")
-                    table.add_row(instance_id, state, name_tag, launch_str)
-                    rows.append([instance_id, state, name_tag, launch_str])
-            if not table.rows:
-                table.add_row("No instances", "", "", "")
-                rows.append(["No instances", "", "", ""])
-            layout["body"].update(table)
-            _record_export("EC2 Instances", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
-        live.refresh()
+            rows = _prefetched_rows("ec2", _fetch_ec2_instances)
+            body = _ec2_instance_table(rows)
+            _record_export("EC2 Instances", EC2_INSTANCE_HEADERS, rows)
+        except _aws_errors() as error:
+            body = Panel(str(error), border_style=_PALETTE.error)
+    _print_result("EC2 Instances", _PALETTE.ec2, body)
     input("Press Enter to return.")
 
 
 def _lambda_list_functions() -> None:
-    with Live(console=console, refresh_per_second=4, screen=False) as live:
-        layout = build_loading_layout("Lambda Functions", _style("lambda"))
-        live.update(layout)
+    from rich.panel import Panel
+
+    title = "Lambda Functions"
+    with _console().status("Fetching Lambda functions…", spinner="dots") as status:
         try:
-            session = _aws_session()
-            aws_lambda = session.client("lambda")
-            paginator = aws_lambda.get_paginator("list_functions")
-            headers = ["Function", "Runtime", "Updated"]
-            rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
-            for page in paginator.paginate():
-                for function in page.get("Functions", []):
-                    name = function.get("FunctionName")
-                    runtime = function.get("Runtime", "?")
-                    updated = function.get("LastModified", "?")
-                    table.add_row(name, runtime, updated)
-                    rows.append([name, runtime, updated])
-            if not table.rows:
-                table.add_row("No functions found", "", "")
-                rows.append(["No functions found", "", ""])
-            layout["body"].update(table)
-            _record_export("Lambda Functions", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
-        live.refresh()
+            rows = _prefetched_rows(
+                "lambda",
+                lambda: _fetch_lambda_functions(
+                    lambda count: status.update(f"Fetching Lambda functions… {count} so far")
+                ),
+            )
+            title = _lambda_title(rows)
+            body = _lambda_function_table(rows)
+            _record_export("Lambda Functions", LAMBDA_FUNCTION_HEADERS, rows)
+        except _aws_errors() as error:
+            body = Panel(str(error), border_style=_PALETTE.error)
+    _print_result(title, _PALETTE.lambda_, body)
+    input("Press Enter to return.")
+
+
+def _resource_overview() -> None:
+    """Fetch the S3, EC2 and Lambda lists side by side so their round trips overlap."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.panel import Panel
+
+    Rows = List[List[str]]
+    views: List[Tuple[str, str, Callable[[Rows], Table], Callable[[Rows], str]]] = [
+        (_PALETTE.s3, "s3", _s3_bucket_table, _s3_title),
+        (_PALETTE.ec2, "ec2", _ec2_instance_table, _ec2_title),
+        (_PALETTE.lambda_, "lambda", _lambda_function_table, _lambda_title),
+    ]
+    results: List[Tuple[str, str, RenderableType]] = []
+    with _console().status("Fetching S3, EC2 and Lambda…", spinner="dots"):
+        with ThreadPoolExecutor(max_workers=len(views)) as pool:
+            futures = [pool.submit(_prefetched_rows, name, _PREFETCH_FETCHERS[name]) for _, name, _, _ in views]
+            for (color, _, build_table, title_for), future in zip(views, futures):
+                try:
+                    rows = future.result()
+                except _aws_errors() as error:
+                    results.append((title_for([]), color, Panel(str(error), border_style=_PALETTE.error)))
+                    continue
+                results.append((title_for(rows), color, build_table(rows)))
+    for title, color, body in results:
+        _print_result(title, color, body)
     input("Press Enter to return.")
 
 
+def _scan_log_group(logs: Any, group_name: str, start_ms: int, end_ms: int) -> Optional[Tuple[int, str]]:
+    """Return (error count, first message) for a log group, or None when it cannot be read.
+
+    Runs on a worker thread; the count stops at the 10 events one FilterLogEvents page returns.
+    """
+    try:
+        # Search for ERROR patterns
+        search_response = logs.filter_log_events(
+            logGroupName=group_name,
+            startTime=start_ms,
+            endTime=end_ms,
+            filterPattern="ERROR",
+            limit=10
+        )
+    except Exception:
+        return None
+    events = search_response.get("events", [])
+    return len(events), events[0].get("message", "") if events else ""
+
+
+def _query_error_summaries(
+    logs: Any, group_names: List[str], start_ms: int, end_ms: int
+) -> Optional[List[Tuple[int, str]]]:
+    """Count ERROR events per group with one Logs Insights query, in ``group_names`` order.
+
+    The matching and counting run in CloudWatch, so counts are exact and only one row
+    per group comes back. Returns None when the query cannot run (no StartQuery
+    permission, an unreadable group, a failed or slow query), so the caller can scan
+    the groups one by one instead.
+    """
+    try:
+        query_id = logs.start_query(
+            logGroupNames=group_names,
+            startTime=start_ms // 1000,
+            endTime=end_ms // 1000,
+            queryString=ERROR_WATCH_QUERY,
+        )["queryId"]
+        deadline = time.monotonic() + ERROR_QUERY_TIMEOUT_SECONDS
+        while True:
+            response = logs.get_query_results(queryId=query_id)
+            status = response.get("status")
+            if status == "Complete":
+                break
+            if status not in ("Scheduled", "Running"):
+                return None
+            if time.monotonic() > deadline:
+                logs.stop_query(queryId=query_id)
+                return None
+            time.sleep(ERROR_QUERY_POLL_SECONDS)
+    except _aws_errors():
+        return None
+
+    found: Dict[str, Tuple[int, str]] = {}
+    for result in response.get("results", []):
+        fields = {field.get("field"): field.get("value", "") for field in result}
+        # @log is "<account id>:<log group name>".
+        group_name = fields.get("@log", "").split(":", 1)[-1]
+        found[group_name] = (int(fields.get("errors") or 0), fields.get("latest", ""))
+    return [found.get(name, (0, "")) for name in group_names]
+
+
 def _error_watch() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = _console()
+
     with Live(console=console, refresh_per_second=2, screen=False) as live:
-        layout = build_loading_layout("Error Watch", _style("error"))
+        layout = build_loading_layout("Error Watch", _PALETTE.error)
         live.update(layout)
         try:
-            session = _aws_session()
-            logs = session.client("logs")
+            logs = _get_client("logs")
             
             # Get recent log groups
             response = logs.describe_log_groups(limit=10)
@@ -717,35 +1322,35 @@ def _error_watch() -> None:
             
             headers = ["Log Group", "Error Count", "Latest Error"]
             rows: List[List[str]] = []
-            table = simple_table(headers, header_style=_style("accent_alt"))
+            table = simple_table(headers, header_style=_PALETTE.accent_alt)
             
-            from datetime import datetime, timedelta
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(hours=1)
+            error_style, success_style = _PALETTE.error, _PALETTE.success
             
-            for log_group in log_groups[:5]:  # Check top 5 groups
-                group_name = log_group.get("logGroupName", "")
-                try:
-                    # Search for ERROR patterns
-                    search_response = logs.filter_log_events(
-                        logGroupName=group_name,
-                        startTime=int(start_time.timestamp() * 1000),
-                        endTime=int(end_time.timestamp() * 1000),
-                        filterPattern="ERROR",
-                        limit=10
-                    )
-                    events = search_response.get("events", [])
-                    error_count = len(events)
-                    latest_error = events[0].get("message", "")[:50] + "..." if events else "None"
+            start_ms = int(start_time.timestamp() * 1000)
+            end_ms = int(end_time.timestamp() * 1000)
+            group_names = [log_group.get("logGroupName", "") for log_group in log_groups[:5]]  # Check top 5 groups
+            summaries: Optional[List[Optional[Tuple[int, str]]]] = None
+            if group_names:
+                summaries = _query_error_summaries(logs, group_names, start_ms, end_ms)
+            if summaries is None:
+                with ThreadPoolExecutor(max_workers=HUB_FETCH_WORKERS) as pool:
+                    summaries = list(pool.map(lambda name: _scan_log_group(logs, name, start_ms, end_ms), group_names))
+
+            for group_name, summary in zip(group_names, summaries):
+                if summary is not None:
+                    error_count, message = summary
+                    latest_error = message[:50] + "..." if error_count else "None"
                     
-                    style = _style("error") if error_count > 0 else _style("success")
+                    style = error_style if error_count > 0 else success_style
                     table.add_row(
                         Text(group_name, style=style),
                         Text(str(error_count), style=style),
                         Text(latest_error, style="dim white")
                     )
                     rows.append([group_name, str(error_count), latest_error])
-                except Exception:
+                else:
                     table.add_row(group_name, "Access denied", "")
                     rows.append([group_name, "Access denied", ""])
             
@@ -755,13 +1360,15 @@ def _error_watch() -> None:
             
             layout["body"].update(table)
             _record_export("Error Watch", headers, rows)
-        except (ClientError, BotoCoreError) as error:
-            layout["body"].update(Panel(str(error), border_style=_style("error")))
+        except _aws_errors() as error:
+            layout["body"].update(Panel(str(error), border_style=_PALETTE.error))
         live.refresh()
     input("Press Enter to return.")
 
 
 def _settings() -> None:
+    console = _console()
+
     config = load_config()
     console.print("Current configuration:")
     for key, value in config.to_dict().items():
@@ -781,6 +1388,8 @@ def launch_hub() -> None:
         print("WonderDash hub needs an interactive terminal. Run this from a shell.")
         return
 
+    console = _console()
+
     actions: Dict[int, Tuple[str, MenuHandler]] = {
         1: ("CloudFront Traffic", _launch_cloudfront),
         2: ("S3 Buckets", _s3_menu),
@@ -792,18 +1401,22 @@ def launch_hub() -> None:
         8: ("Who am I", _who_am_i),
         9: ("Export last table", _export_menu),
         10: ("Toggle dark theme", _toggle_dark_mode),
+        11: ("Resource overview", _resource_overview),
     }
 
+    entries = _menu_entries(actions)
     while True:
-        _menu(actions)
+        _menu(entries)
+        _prefetch_lists()
 
         try:
-            choice = IntPrompt.ask("Select an option", default=1)
+            choice = _ask_int("Select an option", default=1)
         except EOFError:
             console.print("Interactive input is unavailable.", style="red")
             return
 
         if choice == 0:
+            _PREFETCH.clear()
             console.print("Goodbye.")
             return
 
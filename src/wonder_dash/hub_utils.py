@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:  # pragma: no cover - annotations only
+    from rich.layout import Layout
+    from rich.table import Table
 
 
 def build_loading_layout(title: str, color: str = "blue") -> Layout:
+    from rich.layout import Layout
+    from rich.panel import Panel
+
     layout = Layout(name="root")
     layout.split_column(
         Layout(Panel.fit(title, border_style=color, title="AWS"), name="header", size=3),
@@ -18,8 +21,24 @@ def build_loading_layout(title: str, color: str = "blue") -> Layout:
     return layout
 
 
-def simple_table(headers: Iterable[str], header_style: str = "bold cyan") -> Table:
+def simple_table(
+    headers: Iterable[str],
+    header_style: str = "bold cyan",
+    rows: Optional[Iterable[Sequence[str]]] = None,
+    widths: Sequence[Optional[int]] = (),
+) -> Table:
+    """Build a styled table.
+
+    A fixed entry in ``widths`` lets Rich skip measuring that column's cells; the
+    remaining columns then share the spare width so the fixed ones stay exact.
+    """
+    from rich.table import Table
+
     table = Table(expand=True, row_styles=("", "dim"))
-    for header in headers:
-        table.add_column(header, header_style=header_style, overflow="fold")
+    for index, header in enumerate(headers):
+        width = widths[index] if index < len(widths) else None
+        ratio = 1 if widths and width is None else None
+        table.add_column(header, header_style=header_style, overflow="fold", width=width, ratio=ratio)
+    for row in rows or ():
+        table.add_row(*row)
     return table
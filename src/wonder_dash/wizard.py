@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from operator import itemgetter
 from typing import List, Optional
 
 from .config import WonderConfig, save_config
@@ -23,8 +24,13 @@ def _prompt(message: str, default: Optional[str] = None) -> str:
     return input(f"{message}{suffix}: ").strip() or (default or "")
 
 
+# ASCII control bytes; non-ASCII characters are already dropped by the encode step.
+_ASCII_CONTROL_BYTES = bytes(b for b in range(128) if not 32 <= b <= 126)
+
+
 def _clean_ascii(value: str) -> str:
-    return "".join(ch for ch in value if 32 <= ord(ch) <= 126)
+    # Keep printable ASCII only, filtering in C rather than per character in Python.
+    return value.encode("ascii", "ignore").translate(None, _ASCII_CONTROL_BYTES).decode("ascii")
 
 
 def _prompt_int(message: str, default: int, *, min_value: int = 1) -> int:
@@ -63,8 +69,8 @@ def _list_distributions(session: boto3.Session) -> List[str]:
     distribution_ids: List[str] = []
     for page in paginator.paginate():
         items = page.get("DistributionList", {}).get("Items", [])
-        for dist in items or []:
-            distribution_ids.append(dist["Id"])
+        # map(itemgetter) pulls the ids in C; botocore's JMESPath .search() is interpreted Python.
+        distribution_ids.extend(map(itemgetter("Id"), items or ()))
     return distribution_ids
 
 
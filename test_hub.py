@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for WonderDash hub helpers that need no AWS access."""
+
+import sys
+from pathlib import Path
+
+# Add the src directory to the path
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+from wonder_dash import hub
+
+
+class FakeS3:
+    def __init__(self, constraint):
+        self.constraint = constraint
+
+    def get_bucket_location(self, Bucket):
+        return {"LocationConstraint": self.constraint}
+
+
+def test_bucket_region_maps_legacy_constraints():
+    assert hub._bucket_region(FakeS3(None), "b") == "us-east-1"
+    assert hub._bucket_region(FakeS3(""), "b") == "us-east-1"
+    assert hub._bucket_region(FakeS3("EU"), "b") == "eu-west-1"
+    assert hub._bucket_region(FakeS3("ap-south-1"), "b") == "ap-south-1"
+
+
+def _lambda_rows(total, more):
+    from botocore.session import get_session
+    from botocore.stub import Stubber
+
+    client = get_session().create_client(
+        "lambda", region_name="us-east-1", aws_access_key_id="test", aws_secret_access_key="test"
+    )
+    functions = [{"FunctionName": f"fn-{index}"} for index in range(total)]
+    stubber = Stubber(client)
+    stubber.add_response("list_functions", {"Functions": functions[:100], "NextMarker": "page-2"})
+    last_page = {"Functions": functions[100:]}
+    if more:
+        last_page["NextMarker"] = "page-3"
+    stubber.add_response("list_functions", last_page)
+    original = hub._get_client
+    hub._get_client = lambda name, region_name=None: client
+    try:
+        with stubber:
+            return hub._fetch_lambda_functions()
+    finally:
+        hub._get_client = original
+
+
+def test_lambda_title_marks_only_truncated_listings():
+    exact = _lambda_rows(hub.LAMBDA_LIST_MAX_ITEMS, more=False)
+    assert len(exact) == hub.LAMBDA_LIST_MAX_ITEMS
+    assert hub._lambda_title(exact) == "Lambda Functions"
+
+    truncated = _lambda_rows(hub.LAMBDA_LIST_MAX_ITEMS, more=True)
+    assert truncated[-1] == hub.LAMBDA_MORE_ROW
+    assert hub._lambda_title(truncated) == f"Lambda Functions (first {hub.LAMBDA_LIST_MAX_ITEMS})"